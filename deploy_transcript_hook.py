@@ -10,30 +10,63 @@ This script:
 5. Reports results
 """
 
+import importlib.util
+import io
 import json
+import os
+import stat
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, TextIO
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes with a trailing newline."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes with a trailing newline."""
+        return (json.dumps(obj, indent=2) + "\n").encode("utf-8")
+
+# Upper bound on projects deployed concurrently
+MAX_PARALLEL_PROJECTS = 16
 
 
 class TranscriptHookDeployer:
     """Deploys transcript-path-hook-v1 to all Tier1 projects."""
 
-    def __init__(self, dry_run: bool = False):
+    def __init__(self, dry_run: bool = False, isolated: bool = False):
         self.dry_run = dry_run
+        self.isolated = isolated
         self.tier1_root = Path.home() / "tier1_workflow_global"
         self.registry_path = self.tier1_root / "implementation" / "project_registry.json"
         self.update_defs_path = self.tier1_root / "implementation" / "update_definitions.json"
         self.apply_script = self.tier1_root / "template" / "tools" / "apply_update.py"
 
-        # Load registry
-        with open(self.registry_path, "r") as f:
-            self.registry = json.load(f)
+        # Load registry (changes are kept in memory until flush_registry)
+        self.registry = _json_loads(self.registry_path.read_bytes())
+        self._registry_dirty = False
 
         # Load update definitions
-        with open(self.update_defs_path, "r") as f:
-            self.update_defs = json.load(f)
+        self.update_defs = _json_loads(self.update_defs_path.read_bytes())
+        self._updates_by_id = {u["id"]: u for u in self.update_defs.get("updates", [])}
+
+        # Load apply_update.py as a module so components run in-process
+        # (isolated mode spawns one apply_update.py subprocess per component instead)
+        self.apply_update = None
+        if not self.isolated:
+            spec = importlib.util.spec_from_file_location("apply_update", self.apply_script)
+            self.apply_update = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(self.apply_update)
 
     def get_tier1_projects(self) -> List[Dict[str, Any]]:
         """Get all Tier1 workflow projects from registry."""
@@ -46,20 +79,23 @@ class TranscriptHookDeployer:
                 tier1_projects.append(project)
         return tier1_projects
 
-    def apply_update_to_project(self, project: Dict[str, Any]) -> Dict[str, Any]:
+    def apply_update_to_project(self, project: Dict[str, Any], out: Optional[TextIO] = None) -> Dict[str, Any]:
         """
         Apply transcript-path-hook-v1 update to a single project.
 
+        Progress is printed to `out` (a per-project buffer when deploying in parallel).
+
         Returns:
             Result dictionary with status and details
         """
+        out = out or sys.stdout
         project_name = project["name"]
         project_path = Path(project["path"])
 
-        print(f"\n{'='*60}")
-        print(f"Project: {project_name}")
-        print(f"Path: {project_path}")
-        print(f"{'='*60}")
+        print(f"\n{'='*60}", file=out)
+        print(f"Project: {project_name}", file=out)
+        print(f"Path: {project_path}", file=out)
+        print(f"{'='*60}", file=out)
 
         if not project_path.exists():
             return {
@@ -71,11 +107,7 @@ class TranscriptHookDeployer:
             }
 
         # Get update definition
-        update = None
-        for u in self.update_defs.get("updates", []):
-            if u["id"] == "transcript-path-hook-v1":
-                update = u
-                break
+        update = self._updates_by_id.get("transcript-path-hook-v1")
 
         if not update:
             return {
@@ -92,55 +124,56 @@ class TranscriptHookDeployer:
         components_failed = 0
         errors = []
 
-        for idx, component in enumerate(update["components"]):
-            print(f"\nComponent {idx + 1}/{len(update['components'])}: {component['type']}")
-            print(f"  Target: {component['target']}")
-
-            # Run apply_update.py
-            cmd = [
-                "python3",
-                str(self.apply_script),
-                "--project-path", str(project_path),
-                "--update-def", str(self.update_defs_path),
-                "--update-id", "transcript-path-hook-v1",
-                "--component-index", str(idx),
-            ]
-
-            if self.dry_run:
-                cmd.append("--dry-run")
+        components = update["components"]
+        total = len(components)
+        for idx, component in enumerate(components):
+            print(f"\nComponent {idx + 1}/{total}: {component['type']}", file=out)
+            print(f"  Target: {component['target']}", file=out)
 
             try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-
-                # Parse JSON result
-                result_data = json.loads(result.stdout)
-
-                if result_data.get("already_applied"):
-                    print(f"  Status: Already applied (skipped)")
+                if self.isolated:
+                    result_data = self.run_component_subprocess(project_path, idx, component)
+                else:
+                    result_data = self.apply_update.apply_component(
+                        project_path,
+                        self.update_defs,
+                        "transcript-path-hook-v1",
+                        idx,
+                        self.dry_run,
+                        out=out,
+                    )
+
+                if result_data.get("status") == "failure":
+                    print(f"  Status: FAILED", file=out)
+                    print(f"  Error: {result_data.get('error')}", file=out)
+                    components_failed += 1
+                    errors.append({
+                        "component_index": idx,
+                        "error": result_data.get("error"),
+                    })
+                elif result_data.get("already_applied"):
+                    print(f"  Status: Already applied (skipped)", file=out)
                     components_skipped += 1
                 elif result_data.get("changes_made"):
-                    print(f"  Status: Applied successfully")
+                    print(f"  Status: Applied successfully", file=out)
                     components_applied += 1
                 else:
-                    print(f"  Status: No changes made")
+                    print(f"  Status: No changes made", file=out)
                     components_skipped += 1
 
             except subprocess.CalledProcessError as e:
-                print(f"  Status: FAILED")
-                print(f"  Error: {e.stderr}")
+                # Subprocess output is captured as bytes; decode only for reporting
+                stderr = e.stderr.decode("utf-8", errors="replace")
+                print(f"  Status: FAILED", file=out)
+                print(f"  Error: {stderr}", file=out)
                 components_failed += 1
                 errors.append({
                     "component_index": idx,
-                    "error": e.stderr,
+                    "error": stderr,
                 })
             except Exception as e:
-                print(f"  Status: FAILED")
-                print(f"  Error: {str(e)}")
+                print(f"  Status: FAILED", file=out)
+                print(f"  Error: {str(e)}", file=out)
                 components_failed += 1
                 errors.append({
                     "component_index": idx,
@@ -164,8 +197,46 @@ class TranscriptHookDeployer:
             "errors": errors,
         }
 
+    def run_component_subprocess(self, project_path: Path, idx: int, component: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply a component by running apply_update.py in a separate interpreter.
+
+        The already-resolved component is passed as JSON on stdin, so the child
+        does not re-read update_definitions.json.
+
+        Returns:
+            Parsed JSON result printed by apply_update.py
+
+        Raises:
+            subprocess.CalledProcessError: If apply_update.py exits non-zero
+        """
+        cmd = [
+            "python3",
+            str(self.apply_script),
+            "--project-path", str(project_path),
+            "--update-id", "transcript-path-hook-v1",
+            "--component-index", str(idx),
+            "--component-json", "-",
+        ]
+
+        if self.dry_run:
+            cmd.append("--dry-run")
+
+        # close_fds=False allows the posix_spawn fast path; Python-created fds are
+        # non-inheritable by default (PEP 446), so nothing leaks into the child.
+        result = subprocess.run(
+            cmd,
+            input=json.dumps(component).encode("utf-8"),
+            capture_output=True,
+            check=True,
+            close_fds=False,
+        )
+
+        # Parse the JSON result straight from the captured bytes
+        return _json_loads(result.stdout)
+
     def update_registry(self, project_name: str):
-        """Update project registry to mark update as applied."""
+        """Mark update as applied in the in-memory registry (persisted by flush_registry)."""
         if self.dry_run:
             print(f"\n[DRY RUN] Would update registry for {project_name}")
             return
@@ -181,18 +252,25 @@ class TranscriptHookDeployer:
                     project["applied_updates"].append("transcript-path-hook-v1")
 
                 # Update timestamp
-                from datetime import datetime
                 project["last_updated"] = datetime.now().isoformat()
 
+                self._registry_dirty = True
                 break
 
-        # Save registry
-        with open(self.registry_path, "w") as f:
-            json.dump(self.registry, f, indent=2)
-            f.write("\n")
-
         print(f"✅ Registry updated for {project_name}")
 
+    def flush_registry(self):
+        """Write the registry once if it changed (temp file + atomic rename)."""
+        if not self._registry_dirty:
+            return
+
+        tmp_path = self.registry_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(_json_dumps(self.registry))
+        os.replace(tmp_path, self.registry_path)
+        self._registry_dirty = False
+
+        print(f"✅ Registry saved: {self.registry_path}")
+
     def fix_hook_permissions(self, project_path: Path):
         """Ensure capture_transcript_path.py is executable."""
         hook_path = project_path / ".claude" / "hooks" / "capture_transcript_path.py"
@@ -201,7 +279,6 @@ class TranscriptHookDeployer:
             if self.dry_run:
                 print(f"[DRY RUN] Would make {hook_path} executable")
             else:
-                import stat
                 current_perms = hook_path.stat().st_mode
                 hook_path.chmod(current_perms | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
                 print(f"✅ Made {hook_path} executable")
@@ -217,20 +294,39 @@ class TranscriptHookDeployer:
         print(f"Found {len(projects)} Tier1 workflow projects")
         print(f"{'='*60}")
 
-        results = []
-
-        for project in projects:
-            result = self.apply_update_to_project(project)
-            results.append(result)
-
-            # Fix permissions if update was successful
-            if result["status"] in ["success", "already_applied"]:
-                project_path = Path(project["path"])
-                self.fix_hook_permissions(project_path)
-
-                # Update registry
-                if result["status"] == "success":
-                    self.update_registry(project["name"])
+        results_by_index = {}
+
+        # Projects are independent and IO/subprocess-bound, so deploy them on a thread pool.
+        # Each worker buffers its own output; permissions and registry updates run here,
+        # on the main thread, as each project completes.
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(MAX_PARALLEL_PROJECTS, len(projects)))) as executor:
+                futures = {}
+                for index, project in enumerate(projects):
+                    out = io.StringIO()
+                    future = executor.submit(self.apply_update_to_project, project, out)
+                    futures[future] = (index, project, out)
+
+                for future in as_completed(futures):
+                    index, project, out = futures[future]
+                    result = future.result()
+                    results_by_index[index] = result
+                    sys.stdout.write(out.getvalue())
+
+                    # Fix permissions if update was successful
+                    if result["status"] in ["success", "already_applied"]:
+                        project_path = Path(project["path"])
+                        self.fix_hook_permissions(project_path)
+
+                        # Update registry
+                        if result["status"] == "success":
+                            self.update_registry(project["name"])
+        finally:
+            # Single registry write for the whole run, even if a deployment raised
+            self.flush_registry()
+
+        # Keep results in registry order for the summary
+        results = [results_by_index[index] for index in range(len(projects))]
 
         # Print summary
         self.print_summary(results)
@@ -294,10 +390,15 @@ def main():
         action="store_true",
         help="Preview changes without applying them",
     )
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run each component in a separate apply_update.py process",
+    )
 
     args = parser.parse_args()
 
-    deployer = TranscriptHookDeployer(dry_run=args.dry_run)
+    deployer = TranscriptHookDeployer(dry_run=args.dry_run, isolated=args.isolated)
     results = deployer.deploy_all()
 
     # Exit with error code if any deployments failed
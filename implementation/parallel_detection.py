@@ -19,12 +19,22 @@ Output:
 """
 
 import argparse
+import functools
 import json
 import re
 import sys
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Dict, List, Set, Optional
+from typing import Dict, Iterator, List, Set, Optional, Tuple
+
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
 
 
 # Domain classification rules
@@ -83,6 +93,50 @@ DOMAIN_RULES = {
     ],
 }
 
+# One compiled alternation per domain, built at import, so matching a file against
+# a domain is a single search instead of one search per pattern
+DOMAIN_COMBINED = {
+    domain: re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+    for domain, patterns in DOMAIN_RULES.items()
+}
+
+# Fast path: plain "^prefix/" rules become lowercase str.startswith prefixes, and only
+# the remaining rules (extensions, wildcards) stay as one regex per domain
+PREFIX_RULES: Dict[str, Tuple[str, ...]] = {}
+REGEX_RULES: Dict[str, Optional[re.Pattern]] = {}
+for _domain, _patterns in DOMAIN_RULES.items():
+    _prefixes = [p[1:].lower() for p in _patterns if re.fullmatch(r"\^[\w/-]+", p)]
+    _residual = [p for p in _patterns if not re.fullmatch(r"\^[\w/-]+", p)]
+    PREFIX_RULES[_domain] = tuple(_prefixes)
+    REGEX_RULES[_domain] = (
+        re.compile("|".join(f"(?:{p})" for p in _residual), re.IGNORECASE)
+        if _residual else None
+    )
+del _domain, _patterns, _prefixes, _residual
+
+# file-tasks.md extraction patterns, fused so parse_file_tasks scans the document once.
+# Every alternative starts with a different character ("-", "`", "#", "*"; the two
+# list-item forms differ on the first character after the whitespace), so at most
+# one can match at any position. Only that first character is consumed and the rest
+# is a lookahead, so matches of one kind may nest inside another (e.g. bold text in
+# a list item, list items in a code block). The empty group named after the kind
+# marks where the match ends.
+FILE_MENTION_PATTERN = re.compile(
+    # Pattern 1: "- `path/to/file.py` - Description"
+    r'-(?=\s+`(?P<backtick_path>[^`]+)`\s*-(?P<backtick>))'
+    # Pattern 2: "- path/to/file.py"
+    r'|-(?=\s+(?P<item_path>[^\s`]+\.[a-zA-Z0-9]+)(?P<item>))'
+    # Pattern 3: Code blocks with file paths
+    r'|`(?=``[a-z]*\n(?P<code_block_path>[^`]+)```(?P<code_block>))'
+    # Pattern 4: Headers like "### src/backend/service.py"
+    r'|#(?<=^#)(?=#{0,3}\s+(?P<header_path>[^\s`#]+\.[a-zA-Z0-9]+)(?P<header>))'
+    # Pattern 5: Bold file mentions like "**src/api/routes.py**"
+    r'|\*(?=\*(?P<bold_path>[^\s*]+\.[a-zA-Z0-9]+)\*\*(?P<bold>))',
+    re.MULTILINE,
+)
+FILE_MENTION_KINDS = ("backtick", "item", "code_block", "header", "bold")
+CODE_BLOCK_FILE_PATTERN = re.compile(r'([a-zA-Z0-9_\-./]+\.[a-zA-Z0-9]+)')
+
 
 @dataclass
 class ParallelTask:
@@ -133,49 +187,58 @@ def parse_file_tasks(file_path: Path) -> List[str]:
         raise FileNotFoundError(f"File not found: {file_path}")
 
     content = file_path.read_text()
-    files = set()
+    # Insertion-ordered dedup (dict keys), filled during the scan below
+    files: Dict[str, None] = {}
+
+    # Single pass over the document. Like a separate findall per pattern, a match
+    # is skipped if it starts inside the previous match of the same kind.
+    next_start = dict.fromkeys(FILE_MENTION_KINDS, 0)
+    for match in FILE_MENTION_PATTERN.finditer(content):
+        kind = match.lastgroup
+        start, end = match.start(), match.end(kind)
+        if start < next_start[kind]:
+            continue
+        next_start[kind] = end
+
+        path = match.group(f"{kind}_path")
+        if kind == "code_block":
+            # Extract file paths from code blocks
+            potential_files = CODE_BLOCK_FILE_PATTERN.findall(path)
+            # Filter out non-file-path matches (e.g., function.call())
+            files.update(dict.fromkeys(
+                pf for pf in potential_files if '/' in pf or pf.count('.') == 1
+            ))
+        else:
+            files[path] = None
+
+    # Filter out invalid paths (too short, no extension, etc.):
+    # must have at least one character before the extension and a valid extension
+    valid_files = [
+        f for f in map(str.strip, files)
+        if len(f) > 3 and '.' in f and not f.startswith('.')
+    ]
 
-    # Pattern 1: "- `path/to/file.py` - Description"
-    pattern1 = r'-\s+`([^`]+)`\s*-'
-    files.update(re.findall(pattern1, content))
+    return sorted(valid_files)
 
-    # Pattern 2: "- path/to/file.py"
-    pattern2 = r'-\s+([^\s`]+\.[a-zA-Z0-9]+)'
-    files.update(re.findall(pattern2, content))
 
-    # Pattern 3: Code blocks with file paths
-    # Look for ```python or similar followed by file paths
-    code_block_pattern = r'```[a-z]*\n([^`]+)```'
-    code_blocks = re.findall(code_block_pattern, content, re.MULTILINE)
-    for block in code_blocks:
-        # Extract file paths from code blocks
-        file_pattern = r'([a-zA-Z0-9_\-./]+\.[a-zA-Z0-9]+)'
-        potential_files = re.findall(file_pattern, block)
-        # Filter out non-file-path matches (e.g., function.call())
-        for pf in potential_files:
-            if '/' in pf or pf.count('.') == 1:
-                files.add(pf)
+@functools.lru_cache(maxsize=4096)
+def classify_file_multi(file_path: str) -> Tuple[str, ...]:
+    """
+    Find every domain whose path patterns match a file.
 
-    # Pattern 4: Headers like "### src/backend/service.py"
-    header_pattern = r'^#{1,4}\s+([^\s`#]+\.[a-zA-Z0-9]+)'
-    files.update(re.findall(header_pattern, content, re.MULTILINE))
+    Cached, since classify_files and calculate_file_overlap both classify
+    the same paths (DOMAIN_RULES is fixed at import).
 
-    # Pattern 5: Bold file mentions like "**src/api/routes.py**"
-    bold_pattern = r'\*\*([^\s*]+\.[a-zA-Z0-9]+)\*\*'
-    files.update(re.findall(bold_pattern, content))
-
-    # Filter out invalid paths (too short, no extension, etc.)
-    valid_files = []
-    for f in files:
-        f = f.strip()
-        # Must have at least one character before extension
-        # Must have a valid file extension
-        if len(f) > 3 and '.' in f and not f.startswith('.'):
-            valid_files.append(f)
+    Args:
+        file_path: Path to the file
 
-    return sorted(valid_files)
+    Returns:
+        Matching domain names in DOMAIN_RULES order (empty if none match)
+    """
+    return tuple(_iter_matching_domains(file_path))
 
 
+@functools.lru_cache(maxsize=4096)
 def classify_file(file_path: str) -> str:
     """
     Classify a file into a domain based on path patterns.
@@ -186,12 +249,27 @@ def classify_file(file_path: str) -> str:
     Returns:
         Domain name ("backend", "frontend", "database", "tests", "docs", "other")
     """
-    for domain, patterns in DOMAIN_RULES.items():
-        for pattern in patterns:
-            if re.search(pattern, file_path, re.IGNORECASE):
-                return domain
+    return next(_iter_matching_domains(file_path), "other")
+
+
+def _iter_matching_domains(file_path: str) -> Iterator[str]:
+    """Yield the domains matching a file, in DOMAIN_RULES order."""
+    if not file_path.isascii():
+        # IGNORECASE folds some non-ASCII characters (e.g. "\u017f" matches "s")
+        # that str.lower() does not, so non-ASCII paths use the full regexes
+        for domain, regex in DOMAIN_COMBINED.items():
+            if regex.search(file_path):
+                yield domain
+        return
 
-    return "other"
+    lowered = file_path.lower()
+    for domain, prefixes in PREFIX_RULES.items():
+        if lowered.startswith(prefixes):
+            yield domain
+            continue
+        regex = REGEX_RULES[domain]
+        if regex is not None and regex.search(file_path):
+            yield domain
 
 
 def classify_files(files: List[str]) -> Dict[str, List[str]]:
@@ -241,14 +319,8 @@ def calculate_file_overlap(domains: Dict[str, List[str]]) -> float:
     # Check how many files match multiple domain patterns
     shared_count = 0
     for file in all_files:
-        matching_domains = 0
-        for domain_patterns in DOMAIN_RULES.values():
-            for pattern in domain_patterns:
-                if re.search(pattern, file, re.IGNORECASE):
-                    matching_domains += 1
-                    break  # Count each domain only once per file
-
-        if matching_domains > 1:
+        # Reuses the cached classification from classify_files
+        if len(classify_file_multi(file)) > 1:
             shared_count += 1
 
     overlap_percentage = (shared_count / len(all_files)) * 100
@@ -378,22 +450,6 @@ def analyze_parallel_viability(
     )
 
 
-def dataclass_to_dict(obj):
-    """Convert dataclass to dict recursively, handling nested dataclasses."""
-    if hasattr(obj, '__dataclass_fields__'):
-        result = {}
-        for field_name, field_value in asdict(obj).items():
-            if isinstance(field_value, dict):
-                result[field_name] = {
-                    k: dataclass_to_dict(v) if hasattr(v, '__dataclass_fields__') else v
-                    for k, v in field_value.items()
-                }
-            else:
-                result[field_name] = field_value
-        return result
-    return obj
-
-
 def main():
     """Main entry point for CLI usage."""
     parser = argparse.ArgumentParser(
@@ -449,21 +505,12 @@ Examples:
         max_overlap_percentage=args.max_overlap
     )
 
-    # Convert to dictionary for JSON serialization
-    result_dict = dataclass_to_dict(result)
-
-    # Handle nested ParallelTask objects in parallel_plan
-    if result_dict.get('parallel_plan'):
-        result_dict['parallel_plan'] = {
-            domain: {
-                'files': task.files,
-                'task_description': task.task_description
-            }
-            for domain, task in result.parallel_plan.items()
-        }
+    # Convert to dictionary for JSON serialization (asdict recurses into
+    # the ParallelTask values of parallel_plan)
+    result_dict = asdict(result)
 
     # Output JSON to stdout
-    print(json.dumps(result_dict, indent=2))
+    print(_json_dumps(result_dict))
 
     # Exit with appropriate code
     sys.exit(0 if result.viable else 1)
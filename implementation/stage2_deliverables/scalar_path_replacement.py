@@ -13,13 +13,27 @@ DRY RUN by default - use --execute to apply changes.
 """
 
 import argparse
+import functools
 import os
 import re
 import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import Any, List, Tuple, Dict, Optional, Set
 import json
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes."""
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -65,6 +79,9 @@ PATH_PATTERNS = {
     "data_dir": r"/home/andreas-spannbauer/coding_projects/projects/01_second_brain/SCALAR_workflow/data",
 }
 
+# PATH_PATTERNS compiled once at import (used for every file processed)
+COMPILED_PATTERNS = {key: re.compile(pattern) for key, pattern in PATH_PATTERNS.items()}
+
 # Replacement templates
 REPLACEMENTS = {
     # Use environment variables for paths
@@ -81,39 +98,72 @@ REPLACEMENTS = {
     "data_dir": 'str(Path(os.environ.get("SCALAR_ROOT", str(Path.home() / "SCALAR"))) / "data")',
 }
 
+# Strategy 3: PATH_PATTERNS key -> (replacement, change label)
+ENV_VAR_REPLACEMENTS = {
+    "second_brain_root": (REPLACEMENTS["scalar_root"], "SCALAR_ROOT"),
+    "obsidian_vault": (REPLACEMENTS["obsidian_vault"], "OBSIDIAN_VAULT_PATH"),
+    "gpu_server_tailscale": (REPLACEMENTS["gpu_server"], "GPU_SERVER_HOST"),
+    "gpu_server_lan": (REPLACEMENTS["gpu_server"], "GPU_SERVER_HOST"),
+    "model_cache": (REPLACEMENTS["model_cache"], "SCALAR_ROOT/models"),
+    "data_dir": (REPLACEMENTS["data_dir"], "SCALAR_ROOT/data"),
+}
+
 # sys.path.append() calls to remove (redundant with proper package installation)
 SYS_PATH_PATTERNS = [
     r'sys\.path\.append\([^)]+\)',
     r'sys\.path\.insert\([^)]+\)',
 ]
 
+# Strategies 1-3 fused into one alternation, dispatched on the matched group name:
+# sys_path (strategy 1), modules_import (strategy 2: from modules.xxx), and one group
+# per PATH_PATTERNS key (strategy 3, tried in PATH_PATTERNS order)
+_SYS_PATH_BRANCH = f"(?P<sys_path>{'|'.join(SYS_PATH_PATTERNS)})"
+_MODULES_IMPORT_BRANCH = r"(?P<modules_import>from modules\.(?P<module>\w+))"
+_ENV_VAR_BRANCHES = [f"(?P<{key}>{pattern})" for key, pattern in PATH_PATTERNS.items()]
+
+STRATEGY_PATTERN = re.compile("|".join([_SYS_PATH_BRANCH, _MODULES_IMPORT_BRANCH, *_ENV_VAR_BRANCHES]))
+
+# Specialization for files outside modules/, whose modules.xxx imports are left as they
+# are: strategy 2 is dropped from the alternation instead of matching as a no-op
+NON_MODULE_STRATEGY_PATTERN = re.compile("|".join([_SYS_PATH_BRANCH, *_ENV_VAR_BRANCHES]))
+
+# Strategies 2-3 only, re-run over each commented-out sys.path call: the sequential
+# passes rewrote imports and paths inside the "# REMOVED:" comment too, and a fused
+# alternation would otherwise let the sys_path branch swallow them
+INNER_STRATEGY_PATTERN = re.compile("|".join([_MODULES_IMPORT_BRANCH, *_ENV_VAR_BRANCHES]))
+NON_MODULE_INNER_STRATEGY_PATTERN = re.compile("|".join(_ENV_VAR_BRANCHES))
+
+# Incremental-run cache, stored in SCALAR_ROOT by --execute runs: files whose
+# (mtime_ns, size) match a previous NO_CHANGES result are not read again
+CACHE_FILENAME = ".scalar_path_replace_cache.json"
+
+# Literal substrings that every strategy's patterns contain (sys.path calls, modules.*
+# imports, second_brain paths, GPU IPs); used as a cheap prefilter in process_file.
+# ASCII bytes, so they are searched in the raw file before any UTF-8 decode.
+TRIGGER_MARKERS = (
+    b"sys.path",
+    b"from modules.",
+    b"01_second_brain",
+    b"100.102.171.107",
+    b"192.168.10.10",
+)
+
 # ============================================================================
 # STRATEGY 1: Remove sys.path.append() Calls
 # ============================================================================
 
-def remove_sys_path_calls(content: str, dry_run: bool = True) -> Tuple[str, List[str]]:
-    """Remove redundant sys.path.append() and sys.path.insert() calls."""
-    changes = []
-
-    for pattern in SYS_PATH_PATTERNS:
-        matches = re.findall(pattern, content)
-        if matches:
-            for match in matches:
-                changes.append(f"REMOVE: {match}")
-                if not dry_run:
-                    # Comment out instead of deleting (safer)
-                    content = content.replace(match, f"# REMOVED: {match}")
-
-    return content, changes
+def _comment_out_sys_path(match: re.Match, changes: List[str]) -> str:
+    """Replacement for a redundant sys.path.append()/insert() call."""
+    changes.append(f"REMOVE: {match.group(0)}")
+    # Comment out instead of deleting (safer)
+    return f"# REMOVED: {match.group(0)}"
 
 # ============================================================================
 # STRATEGY 2: Convert to Relative Imports
 # ============================================================================
 
-def convert_to_relative_imports(content: str, file_path: Path, dry_run: bool = True) -> Tuple[str, List[str]]:
-    """Convert absolute imports to relative imports where possible."""
-    changes = []
-
+def _relative_import_prefix(file_path: Path) -> Optional[str]:
+    """Leading dots for relative imports in file_path, or None if it is outside modules/."""
     # Pattern: from modules.xxx import yyy
     # Should be: from .xxx import yyy (if in modules/)
     # or: from ..xxx import yyy (if in modules/submodule/)
@@ -123,82 +173,106 @@ def convert_to_relative_imports(content: str, file_path: Path, dry_run: bool = T
         parts = file_path.relative_to(SCALAR_ROOT).parts
         if parts[0] == "modules":
             depth = len(parts) - 2  # -2 for "modules" and filename
+            return '.' * (depth + 1) if depth >= 0 else '.'
 
-            # Find absolute imports
-            import_pattern = r'from modules\.(\w+)'
-            matches = re.findall(import_pattern, content)
+    return None
 
-            for match in matches:
-                old_import = f"from modules.{match}"
-                new_import = f"from {'.' * (depth + 1)}{match}" if depth >= 0 else f"from .{match}"
+def _to_relative_import(match: re.Match, prefix: str, converted: Dict[str, str]) -> str:
+    """Replacement for an absolute modules.xxx import (records each distinct import once)."""
+    old_import = match.group(0)
+    new_import = f"from {prefix}{match.group('module')}"
+    converted.setdefault(old_import, new_import)
+    return new_import
 
-                if old_import in content:
-                    changes.append(f"RELATIVE: {old_import} → {new_import}")
-                    if not dry_run:
-                        content = content.replace(old_import, new_import)
+def _replace_pattern(pattern: re.Pattern, replacement: str, content: str, dry_run: bool) -> Tuple[str, bool]:
+    """Replace all matches in one pass (subn); in dry-run mode only check for a match."""
+    if dry_run:
+        return content, pattern.search(content) is not None
 
-    return content, changes
+    content, count = pattern.subn(replacement, content)
+    return content, count > 0
 
 # ============================================================================
 # STRATEGY 3: Extract to Environment Variables
 # ============================================================================
 
-def extract_to_env_vars(content: str, dry_run: bool = True) -> Tuple[str, List[str]]:
-    """Replace hardcoded paths with environment variable lookups."""
-    changes = []
+def _to_env_var(match: re.Match, matched: Set[str]) -> str:
+    """Replacement for a hardcoded path or IP (records which PATH_PATTERNS key matched)."""
+    matched.add(match.lastgroup)
+    return ENV_VAR_REPLACEMENTS[match.lastgroup][0]
 
-    replacements_made = []
-
-    # Replace second_brain root paths
-    pattern = PATH_PATTERNS["second_brain_root"]
-    if re.search(pattern, content):
-        changes.append(f"ENV_VAR: {pattern} → SCALAR_ROOT")
-        if not dry_run:
-            content = re.sub(pattern, REPLACEMENTS["scalar_root"], content)
-        replacements_made.append("SCALAR_ROOT")
-
-    # Replace Obsidian vault paths
-    pattern = PATH_PATTERNS["obsidian_vault"]
-    if re.search(pattern, content):
-        changes.append(f"ENV_VAR: {pattern} → OBSIDIAN_VAULT_PATH")
-        if not dry_run:
-            content = re.sub(pattern, REPLACEMENTS["obsidian_vault"], content)
-        replacements_made.append("OBSIDIAN_VAULT_PATH")
-
-    # Replace GPU server IPs
-    for gpu_key in ["gpu_server_tailscale", "gpu_server_lan"]:
-        pattern = PATH_PATTERNS[gpu_key]
-        if re.search(pattern, content):
-            changes.append(f"ENV_VAR: {pattern} → GPU_SERVER_HOST")
-            if not dry_run:
-                content = re.sub(pattern, REPLACEMENTS["gpu_server"], content)
-            replacements_made.append("GPU_SERVER_HOST")
-
-    # Replace model cache paths
-    pattern = PATH_PATTERNS["model_cache"]
-    if re.search(pattern, content):
-        changes.append(f"ENV_VAR: {pattern} → SCALAR_ROOT/models")
-        if not dry_run:
-            content = re.sub(pattern, REPLACEMENTS["model_cache"], content)
-        replacements_made.append("MODEL_CACHE")
-
-    # Replace data directory paths
-    pattern = PATH_PATTERNS["data_dir"]
-    if re.search(pattern, content):
-        changes.append(f"ENV_VAR: {pattern} → SCALAR_ROOT/data")
-        if not dry_run:
-            content = re.sub(pattern, REPLACEMENTS["data_dir"], content)
-        replacements_made.append("DATA_DIR")
+def _add_env_var_imports(content: str, changes: List[str]) -> str:
+    """Add the imports that the environment variable lookups need."""
+    need_os = "import os" not in content and "from os import" not in content
+    need_path = "from pathlib import Path" not in content and "import pathlib" not in content
 
-    # Add required imports if replacements were made
-    if replacements_made and not dry_run:
-        if "import os" not in content and "from os import" not in content:
-            content = "import os\n" + content
-            changes.append("IMPORT: Added 'import os'")
+    # Imports go in a header that is joined onto the content once (pathlib line first)
+    header = []
+    if need_path:
+        header.append("from pathlib import Path\n")
+    if need_os:
+        header.append("import os\n")
+        changes.append("IMPORT: Added 'import os'")
+    if need_path:
+        changes.append("IMPORT: Added 'from pathlib import Path'")
 
-        if "from pathlib import Path" not in content and "import pathlib" not in content:
-            content = "from pathlib import Path\n" + content
-            changes.append("IMPORT: Added 'from pathlib import Path'")
+    return "".join(header) + content if header else content
+
+# ============================================================================
+# STRATEGIES 1-3: Single Pass
+# ============================================================================
+
+def apply_path_strategies(content: str, file_path: Path, dry_run: bool = True) -> Tuple[str, List[str]]:
+    """
+    Apply strategies 1-3 in one regex pass over the file.
+
+    Each STRATEGY_PATTERN match is dispatched on its group name to the strategy's
+    replacement; changes are reported grouped by strategy, in strategy order.
+    Files outside modules/ are scanned with NON_MODULE_STRATEGY_PATTERN instead.
+    Paths and imports inside a sys.path call are rewritten within the commented-out
+    call, so the result and the reported changes are the same as running strategies
+    1, 2 and 3 in sequence. The one exception is a `from modules.xxx` name running
+    straight into a hardcoded IP or a sys.path call (not valid Python): the import
+    match takes the shared characters, where the sequential passes let the earlier
+    strategy have them.
+    """
+    sys_path_changes = []
+    converted_imports = {}
+    matched_paths = set()
+    import_prefix = _relative_import_prefix(file_path)
+
+    if import_prefix is not None:
+        pattern, inner_pattern = STRATEGY_PATTERN, INNER_STRATEGY_PATTERN
+    else:
+        pattern, inner_pattern = NON_MODULE_STRATEGY_PATTERN, NON_MODULE_INNER_STRATEGY_PATTERN
+
+    def replace(match: re.Match) -> str:
+        kind = match.lastgroup
+        if kind == "sys_path":
+            # Same result as strategies 2-3 running after strategy 1
+            return inner_pattern.sub(replace, _comment_out_sys_path(match, sys_path_changes))
+        if kind == "modules_import":
+            return _to_relative_import(match, import_prefix, converted_imports)
+        return _to_env_var(match, matched_paths)
+
+    new_content = pattern.sub(replace, content)
+    if not dry_run:
+        content = new_content
+
+    changes = sys_path_changes
+    changes.extend(
+        f"RELATIVE: {old_import} → {new_import}"
+        for old_import, new_import in converted_imports.items()
+    )
+    # Env var replacements are reported once per pattern, in PATH_PATTERNS order
+    changes.extend(
+        f"ENV_VAR: {pattern} → {ENV_VAR_REPLACEMENTS[key][1]}"
+        for key, pattern in PATH_PATTERNS.items() if key in matched_paths
+    )
+
+    # Add required imports if replacements were made
+    if matched_paths and not dry_run:
+        content = _add_env_var_imports(content, changes)
 
     return content, changes
 
@@ -213,21 +287,19 @@ def context_aware_replacements(content: str, file_path: Path, dry_run: bool = Tr
     # YAML config files
     if file_path.suffix in ['.yaml', '.yml']:
         # Replace hardcoded paths with ${SCALAR_ROOT} template variables
-        pattern = PATH_PATTERNS["second_brain_root"]
-        if re.search(pattern, content):
-            changes.append(f"YAML: {pattern} → ${{SCALAR_ROOT}}")
-            if not dry_run:
-                content = re.sub(pattern, "${SCALAR_ROOT}", content)
+        pattern = COMPILED_PATTERNS["second_brain_root"]
+        content, found = _replace_pattern(pattern, "${SCALAR_ROOT}", content, dry_run)
+        if found:
+            changes.append(f"YAML: {pattern.pattern} → ${{SCALAR_ROOT}}")
 
     # GPU config files
     if "gpu" in file_path.name.lower() or "gpu_services" in str(file_path):
         # Replace GPU IPs with environment variable references
         for gpu_key in ["gpu_server_tailscale", "gpu_server_lan"]:
-            pattern = PATH_PATTERNS[gpu_key]
-            if re.search(pattern, content):
-                changes.append(f"GPU_CONFIG: {pattern} → ${{GPU_SERVER_HOST}}")
-                if not dry_run:
-                    content = re.sub(pattern, "${GPU_SERVER_HOST}", content)
+            pattern = COMPILED_PATTERNS[gpu_key]
+            content, found = _replace_pattern(pattern, "${GPU_SERVER_HOST}", content, dry_run)
+            if found:
+                changes.append(f"GPU_CONFIG: {pattern.pattern} → ${{GPU_SERVER_HOST}}")
 
     return content, changes
 
@@ -235,22 +307,37 @@ def context_aware_replacements(content: str, file_path: Path, dry_run: bool = Tr
 # MAIN PROCESSING
 # ============================================================================
 
+def _fast_backup(src: Path, dst: Path) -> None:
+    """
+    Back up src as a hardlink (no data copied), falling back to shutil.copy2.
+
+    Safe because process_file never writes the original in place: the new content
+    is renamed over it, so the backup keeps the old inode and contents.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Existing backup, cross-device, or no hardlink support
+        shutil.copy2(src, dst)
+
+def skipped_result(file_path: Path) -> Dict:
+    """Result for a file that does not exist."""
+    return {
+        "file": str(file_path),
+        "status": "SKIPPED",
+        "reason": "File not found",
+        "changes": [],
+        "change_count": 0
+    }
+
 def process_file(file_path: Path, dry_run: bool = True, create_backup: bool = True) -> Dict:
     """Process a single file with all replacement strategies."""
 
-    if not file_path.exists():
-        return {
-            "file": str(file_path),
-            "status": "SKIPPED",
-            "reason": "File not found",
-            "changes": [],
-            "change_count": 0
-        }
-
-    # Read file
+    # Read file (a missing file surfaces here rather than via a separate exists() stat)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            original_content = f.read()
+        raw_content = file_path.read_bytes()
+    except FileNotFoundError:
+        return skipped_result(file_path)
     except Exception as e:
         return {
             "file": str(file_path),
@@ -260,34 +347,45 @@ def process_file(file_path: Path, dry_run: bool = True, create_backup: bool = Tr
             "change_count": 0
         }
 
-    content = original_content
     all_changes = []
 
-    # Apply all strategies
-    content, changes = remove_sys_path_calls(content, dry_run)
-    all_changes.extend(changes)
-
-    content, changes = convert_to_relative_imports(content, file_path, dry_run)
-    all_changes.extend(changes)
+    # Files containing none of the trigger literals cannot match any strategy; they
+    # are filtered on the raw bytes and never decoded
+    if any(marker in raw_content for marker in TRIGGER_MARKERS):
+        try:
+            original_content = raw_content.decode('utf-8')
+        except UnicodeDecodeError as e:
+            return {
+                "file": str(file_path),
+                "status": "ERROR",
+                "reason": f"Read error: {str(e)}",
+                "changes": [],
+                "change_count": 0
+            }
 
-    content, changes = extract_to_env_vars(content, dry_run)
-    all_changes.extend(changes)
+        # Apply all strategies (1-3 share a single pass)
+        content, changes = apply_path_strategies(original_content, file_path, dry_run)
+        all_changes.extend(changes)
 
-    content, changes = context_aware_replacements(content, file_path, dry_run)
-    all_changes.extend(changes)
+        content, changes = context_aware_replacements(content, file_path, dry_run)
+        all_changes.extend(changes)
 
-    # Write changes if not dry run
-    if not dry_run and all_changes:
+    # Write changes if not dry run (no backup or rewrite if the text came out identical)
+    if not dry_run and all_changes and content != original_content:
         # Create backup
         if create_backup:
             backup_path = file_path.with_suffix(file_path.suffix + '.backup')
-            shutil.copy2(file_path, backup_path)
+            _fast_backup(file_path, backup_path)
 
-        # Write updated content
+        # Write updated content in one write to a temp file, then rename it over
+        # the original (atomic, so an interrupted run never truncates a file)
+        tmp_path = file_path.with_suffix(file_path.suffix + '.tmp')
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            tmp_path.write_bytes(content.encode('utf-8'))
+            shutil.copymode(file_path, tmp_path)
+            os.replace(tmp_path, file_path)
         except Exception as e:
+            tmp_path.unlink(missing_ok=True)
             return {
                 "file": str(file_path),
                 "status": "ERROR",
@@ -307,6 +405,48 @@ def process_file(file_path: Path, dry_run: bool = True, create_backup: bool = Tr
         "change_count": len(all_changes)
     }
 
+def scan_existing(root: Path, rel_paths: List[str]) -> Dict[str, os.DirEntry]:
+    """Map each existing relative path to its directory entry.
+
+    Uses one os.scandir() per distinct parent directory instead of a stat per file.
+    """
+    by_dir: Dict[str, List[str]] = {}
+    for rel_path in rel_paths:
+        parent, _, name = rel_path.rpartition('/')
+        by_dir.setdefault(parent, []).append(name)
+
+    existing = {}
+    for parent, names in by_dir.items():
+        try:
+            with os.scandir(root / parent) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            continue
+        for name in names:
+            if name in entries:
+                existing[f"{parent}/{name}" if parent else name] = entries[name]
+    return existing
+
+def load_cache(cache_path: Path) -> Dict[str, List[int]]:
+    """Load {relative path: [mtime_ns, size]} of unchanged files (empty if missing or stale)."""
+    try:
+        with open(cache_path, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    # Entries only hold for the patterns they were computed with
+    if not isinstance(cache, dict) or cache.get("patterns") != STRATEGY_PATTERN.pattern:
+        return {}
+    return cache.get("files", {})
+
+def save_cache(cache_path: Path, files: Dict[str, List[int]]) -> None:
+    """Write the unchanged-files cache (temp file + atomic rename)."""
+    tmp_path = cache_path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump({"patterns": STRATEGY_PATTERN.pattern, "files": files}, f)
+    os.replace(tmp_path, cache_path)
+
 def main():
     parser = argparse.ArgumentParser(
         description="SCALAR Path Replacement Script - Fix hardcoded paths",
@@ -327,6 +467,11 @@ def main():
         type=str,
         help="Save report to JSON file"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-scan every file, ignoring and not updating {CACHE_FILENAME}"
+    )
 
     args = parser.parse_args()
 
@@ -352,23 +497,61 @@ def main():
     print(f"Files to process: {len(FILES_TO_UPDATE)}")
     print()
 
-    # Process all files
+    cache_path = SCALAR_ROOT / CACHE_FILENAME
+    cache = {} if args.no_cache else load_cache(cache_path)
+    stat_keys = {}
+    unchanged = {}
+
+    # Process all files. They are independent, so they run in worker processes;
+    # results are collected in FILES_TO_UPDATE order for the progress output.
+    # Files unchanged since a previous NO_CHANGES result are not submitted at all.
     results = []
-    for rel_path in FILES_TO_UPDATE:
-        file_path = SCALAR_ROOT / rel_path
-        print(f"Processing: {rel_path}")
-
-        result = process_file(file_path, dry_run, create_backup)
-        results.append(result)
-
-        print(f"  Status: {result['status']}")
-        if result['changes']:
-            print(f"  Changes: {result['change_count']}")
-            for change in result['changes'][:3]:  # Show first 3
-                print(f"    - {change}")
-            if result['change_count'] > 3:
-                print(f"    ... and {result['change_count'] - 3} more")
-        print()
+    process = functools.partial(process_file, dry_run=dry_run, create_backup=create_backup)
+    existing = scan_existing(SCALAR_ROOT, FILES_TO_UPDATE)
+    with ProcessPoolExecutor(max_workers=min(len(FILES_TO_UPDATE), os.cpu_count() or 1)) as executor:
+        futures = {}
+        for rel_path, entry in existing.items():
+            try:
+                st = entry.stat()
+            except OSError:
+                pass
+            else:
+                stat_keys[rel_path] = [st.st_mtime_ns, st.st_size]
+                if cache.get(rel_path) == stat_keys[rel_path]:
+                    continue
+            futures[rel_path] = executor.submit(process, SCALAR_ROOT / rel_path)
+
+        for rel_path in FILES_TO_UPDATE:
+            if rel_path in futures:
+                result = futures[rel_path].result()
+            elif rel_path not in existing:
+                result = skipped_result(SCALAR_ROOT / rel_path)
+            else:
+                result = {
+                    "file": str(Path(rel_path)),
+                    "status": "NO_CHANGES",
+                    "changes": [],
+                    "change_count": 0
+                }
+            if result['status'] == "NO_CHANGES" and rel_path in stat_keys:
+                unchanged[rel_path] = stat_keys[rel_path]
+
+            results.append(result)
+
+            # Per-file progress stanza, emitted with a single write
+            lines = [f"Processing: {rel_path}\n", f"  Status: {result['status']}\n"]
+            if result['changes']:
+                lines.append(f"  Changes: {result['change_count']}\n")
+                for change in result['changes'][:3]:  # Show first 3
+                    lines.append(f"    - {change}\n")
+                if result['change_count'] > 3:
+                    lines.append(f"    ... and {result['change_count'] - 3} more\n")
+            lines.append("\n")
+            sys.stdout.write("".join(lines))
+
+    # Only an applied run records results (a dry run must not write into SCALAR_ROOT)
+    if not dry_run and not args.no_cache:
+        save_cache(cache_path, unchanged)
 
     # Summary
     print("=" * 80)
@@ -414,8 +597,8 @@ def main():
             "results": results
         }
 
-        with open(args.output, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(args.output, 'wb') as f:
+            f.write(_json_dumps(report))
 
         print(f"Report saved to: {args.output}")
         print()
@@ -21,11 +21,30 @@ Usage:
 
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
-class CommitType(Enum):
-    """Conventional Commit types"""
+# (path fragment, scope) in priority order: a match on an earlier entry in any file wins
+SCOPE_MARKERS = (
+    ('.claude/agents/', 'agents'),
+    ('.tasks/', 'epic-registry'),
+    ('tools/', 'tools'),
+    ('.claude/commands/', 'commands'),
+)
+
+
+try:
+    from enum import StrEnum
+except ImportError:  # Python < 3.11
+    class StrEnum(str, Enum):
+        """Enum whose members are strings and format as their value"""
+
+        def __str__(self) -> str:
+            return str.__str__(self)
+
+
+class CommitType(StrEnum):
+    """Conventional Commit types (members are their type strings)"""
     FEAT = "feat"        # New feature
     FIX = "fix"          # Bug fix
     DOCS = "docs"        # Documentation only
@@ -56,9 +75,9 @@ def generate_commit_message(
     """
     # Build first line
     if scope:
-        first_line = f"{commit_type.value}({scope}): {description}"
+        first_line = f"{commit_type}({scope}): {description}"
     else:
-        first_line = f"{commit_type.value}: {description}"
+        first_line = f"{commit_type}: {description}"
 
     # Truncate if too long
     if len(first_line) > max_length:
@@ -74,26 +93,33 @@ def generate_commit_message(
 
 def infer_commit_type_from_files(files: List[str]) -> CommitType:
     """Infer commit type from modified files"""
-    if any('test' in f.lower() for f in files):
-        return CommitType.TEST
-    elif any(f.endswith('.md') or 'docs/' in f for f in files):
-        return CommitType.DOCS
-    else:
-        return CommitType.CHORE  # Safe default
-
-
-def infer_scope_from_files(files: List[str]) -> Optional[str]:
-    """Infer scope from file paths"""
-    if any('.claude/agents/' in f for f in files):
-        return 'agents'
-    elif any('.tasks/' in f for f in files):
-        return 'epic-registry'
-    elif any('tools/' in f for f in files):
-        return 'tools'
-    elif any('.claude/commands/' in f for f in files):
-        return 'commands'
-    else:
-        return None
+    # Single pass: any test file wins outright, otherwise docs if any were seen
+    has_docs = False
+    for f in files:
+        if 'test' in f.lower():
+            return CommitType.TEST
+        if not has_docs and (f.endswith('.md') or 'docs/' in f):
+            has_docs = True
+
+    return CommitType.DOCS if has_docs else CommitType.CHORE  # CHORE: safe default
+
+
+def infer_scope_from_files(
+    files: List[str],
+    markers: Tuple[Tuple[str, str], ...] = SCOPE_MARKERS
+) -> Optional[str]:
+    """Infer scope from file paths (markers: (fragment, scope) pairs in priority order)"""
+    # Single pass over files, stopping early once the top-priority marker is found
+    best = len(markers)
+    for f in files:
+        for rank in range(best):
+            if markers[rank][0] in f:
+                best = rank
+                break
+        if best == 0:
+            break
+
+    return markers[best][1] if best < len(markers) else None
 
 
 if __name__ == "__main__":
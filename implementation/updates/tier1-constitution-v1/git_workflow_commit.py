@@ -13,12 +13,41 @@ Usage:
 
 import argparse
 import json
+import re
 import subprocess
 import sys
+from functools import cached_property
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 
-from generate_commit_message import generate_commit_message, CommitType
+from generate_commit_message import generate_commit_message, infer_scope_from_files, CommitType
+
+# Combined path length above which `git add` reads pathspecs from stdin instead of
+# argv (keeps well under the OS argument-size limit)
+GIT_ADD_ARGV_LIMIT = 100_000
+
+# Config group: .claude/, .tasks/, *.json, *.yaml (tuple forms for one startswith/endswith call)
+CONFIG_PREFIXES = ('.claude/', '.tasks/')
+CONFIG_SUFFIXES = ('.json', '.yaml', '.yml')
+
+# Group classifier: one anchored match whose zero-width branches are tried in group
+# priority order (docs, tests, tools, config); m.lastgroup names the bucket, no match
+# means src. DOTALL/\Z because -z status paths may contain newlines.
+CLASSIFY_PATTERN = re.compile(
+    r"(?P<docs>(?=.*(?:\.md\Z|docs/)))"
+    r"|(?P<tests>(?=.*(?ai:test)))"
+    r"|(?P<tools>(?=tools/))"
+    r"|(?P<config>(?=" + "|".join(map(re.escape, CONFIG_PREFIXES)) +
+    r"|.*(?:" + "|".join(map(re.escape, CONFIG_SUFFIXES)) + r")\Z))",
+    re.DOTALL
+)
+
+# Scope markers for source-code groups, in priority order (see infer_scope_from_files)
+SCOPE_MARKERS = (
+    ('.claude/agents/', 'agents'),
+    ('.tasks/', 'epic-registry'),
+    ('.claude/commands/', 'commands'),
+)
 
 
 class GitWorkflowCommit:
@@ -27,25 +56,26 @@ class GitWorkflowCommit:
     def __init__(self, project_root: Path):
         self.project_root = project_root
 
-    def is_dirty(self) -> bool:
-        """Check if working directory has changes"""
+    @cached_property
+    def _status(self) -> bytes:
+        """Raw `git status --porcelain=v1 -z` output, run once until the next commit"""
         result = subprocess.run(
-            ["git", "status", "--porcelain"],
+            ["git", "status", "--porcelain=v1", "-z"],
             capture_output=True,
-            text=True,
             cwd=self.project_root
         )
-        return bool(result.stdout.strip())
+        return result.stdout
+
+    def _invalidate_status(self):
+        """Drop the cached status after staging/committing changed the repository"""
+        self.__dict__.pop("_status", None)
+
+    def is_dirty(self) -> bool:
+        """Check if working directory has changes"""
+        return bool(self._status)
 
     def get_status(self) -> Dict[str, List[str]]:
         """Get git status categorized by change type"""
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            capture_output=True,
-            text=True,
-            cwd=self.project_root
-        )
-
         status = {
             "modified": [],
             "added": [],
@@ -53,23 +83,17 @@ class GitWorkflowCommit:
             "untracked": []
         }
 
-        for line in result.stdout.strip().split('\n'):
-            if not line:
+        # -z output: NUL-terminated "XY <path>" records (X=index, Y=worktree) with
+        # unquoted paths; a rename/copy is followed by one more record, its source path
+        records = iter(self._status.split(b"\0"))
+        for record in records:
+            if len(record) < 4:
                 continue
 
-            # Git status format: XY filename (X=index, Y=worktree)
-            # Format can be "XY filename" where XY is 2 chars
-            # The filename starts after a space, which may be at position 2 or 3
-            if len(line) < 3:
-                continue
-
-            # Split on space to properly separate status from filename
-            parts = line.split(None, 1)  # Split on whitespace, max 2 parts
-            if len(parts) != 2:
-                continue
-
-            state = parts[0]
-            file_path = parts[1]
+            state = record[:2].decode("ascii")
+            file_path = record[3:].decode("utf-8", "surrogateescape")
+            if state[0] in "RC":
+                next(records, None)
 
             # Check both index and worktree status
             if 'M' in state:
@@ -94,56 +118,55 @@ class GitWorkflowCommit:
             status["untracked"]
         )
 
+        # Single pass: each file goes to the first category it matches
+        buckets: Dict[str, List[str]] = {"docs": [], "tests": [], "tools": [], "config": [], "src": []}
+        assigned = set()
+        classify = CLASSIFY_PATTERN.match
+        for f in all_files:
+            if f in assigned:
+                continue
+            assigned.add(f)
+            m = classify(f)
+            buckets[m.lastgroup if m else "src"].append(f)
+
         # Group 1: Documentation (*.md, docs/)
-        doc_files = [f for f in all_files if f.endswith('.md') or 'docs/' in f]
-        if doc_files:
+        if buckets["docs"]:
             groups.append({
                 "type": CommitType.DOCS,
                 "scope": None,
-                "files": doc_files,
+                "files": buckets["docs"],
                 "description": "Update documentation"
             })
 
         # Group 2: Tests (test_*, *_test.py, tests/)
-        test_files = [f for f in all_files if 'test' in f.lower() and f not in doc_files]
-        if test_files:
+        if buckets["tests"]:
             groups.append({
                 "type": CommitType.TEST,
                 "scope": None,
-                "files": test_files,
+                "files": buckets["tests"],
                 "description": "Update tests"
             })
 
         # Group 3: Tools (tools/, scripts/)
-        tool_files = [f for f in all_files if f.startswith('tools/') and f not in doc_files + test_files]
-        if tool_files:
+        if buckets["tools"]:
             groups.append({
                 "type": CommitType.CHORE,
                 "scope": "tools",
-                "files": tool_files,
+                "files": buckets["tools"],
                 "description": "Update tools"
             })
 
         # Group 4: Config (.claude/, .tasks/, *.json, *.yaml)
-        config_files = [
-            f for f in all_files
-            if (f.startswith('.claude/') or f.startswith('.tasks/') or
-                f.endswith('.json') or f.endswith('.yaml') or f.endswith('.yml'))
-            and f not in doc_files + test_files + tool_files
-        ]
-        if config_files:
+        if buckets["config"]:
             groups.append({
                 "type": CommitType.CHORE,
                 "scope": "config",
-                "files": config_files,
+                "files": buckets["config"],
                 "description": "Update configuration"
             })
 
         # Group 5: Source code (everything else)
-        other_files = [
-            f for f in all_files
-            if f not in doc_files + test_files + tool_files + config_files
-        ]
+        other_files = buckets["src"]
         if other_files:
             # Infer if feat or fix based on file content changes
             commit_type = self._infer_commit_type(other_files)
@@ -164,22 +187,22 @@ class GitWorkflowCommit:
 
     def _infer_scope(self, files: List[str]) -> Optional[str]:
         """Infer scope from file paths"""
-        # Check common patterns
-        if any('.claude/agents/' in f for f in files):
-            return 'agents'
-        elif any('.tasks/' in f for f in files):
-            return 'epic-registry'
-        elif any('.claude/commands/' in f for f in files):
-            return 'commands'
-        else:
-            return None
+        return infer_scope_from_files(files, SCOPE_MARKERS)
 
     def create_commit(self, group: Dict, context: Optional[str] = None) -> bool:
         """Create a commit for a group of changes"""
-        # Stage files
-        for file_path in group["files"]:
+        # Stage files (one git invocation for the whole group)
+        files = group["files"]
+        if sum(len(f) + 1 for f in files) <= GIT_ADD_ARGV_LIMIT:
+            subprocess.run(
+                ["git", "add", "--", *files],
+                cwd=self.project_root,
+                check=True
+            )
+        else:
             subprocess.run(
-                ["git", "add", file_path],
+                ["git", "add", "--pathspec-from-file=-", "--pathspec-file-nul"],
+                input="\0".join(files).encode("utf-8", "surrogateescape"),
                 cwd=self.project_root,
                 check=True
             )
@@ -200,6 +223,7 @@ class GitWorkflowCommit:
             text=True,
             cwd=self.project_root
         )
+        self._invalidate_status()
 
         return result.returncode == 0
 
@@ -215,7 +239,7 @@ class GitWorkflowCommit:
 
         print(f"\n📦 Found {len(groups)} logical change groups:")
         for i, group in enumerate(groups, 1):
-            print(f"  {i}. {group['type'].value}({group['scope']}): {len(group['files'])} files")
+            print(f"  {i}. {group['type']}({group['scope']}): {len(group['files'])} files")
 
         print("\n🔨 Creating focused commits...")
         for i, group in enumerate(groups, 1):
@@ -264,6 +288,7 @@ class GitWorkflowCommit:
             text=True,
             cwd=self.project_root
         )
+        self._invalidate_status()
 
         if result.returncode == 0:
             print(f"✅ Workflow results committed: {epic_id}")
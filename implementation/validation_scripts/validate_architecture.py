@@ -6,7 +6,7 @@ PURPOSE: Enforce architectural boundaries in your codebase
 
 CUSTOMIZE THIS FILE for your project:
 - Update LAYER_DEPENDENCIES to match your architecture
-- Update FORBIDDEN_PATTERNS to enforce your rules
+- Update FORBIDDEN_PATTERNS (forbidden module imports per layer) to enforce your rules
 - Update file paths to match your project structure
 
 EXAMPLE: Layered architecture (Clean Architecture, Hexagonal Architecture)
@@ -17,10 +17,13 @@ EXAMPLE: Layered architecture (Clean Architecture, Hexagonal Architecture)
 This is a TEMPLATE - adapt it to your project's needs.
 """
 
+import ast
+import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set
-import re
+from typing import Dict, Iterator, List, Set
 
 # ==============================================================================
 # CUSTOMIZE THESE FOR YOUR PROJECT
@@ -35,25 +38,23 @@ LAYER_DEPENDENCIES: Dict[str, Set[str]] = {
     "api": {"application", "domain"},  # API can use application and domain
 }
 
-# Define forbidden import patterns (regex)
+# Define forbidden imports: files in "in_layer" must not import "module" or any of
+# its submodules (with or without the src. prefix). Entries written for earlier
+# versions of this template, with a "pattern" regex instead of "module", are still
+# accepted and matched against the file text as before.
 FORBIDDEN_PATTERNS: List[Dict[str, str]] = [
     {
-        "pattern": r"from\s+(?:src\.)?infrastructure\.",
-        "in_layer": "domain",
-        "message": "Domain layer cannot import infrastructure layer",
-    },
-    {
-        "pattern": r"import\s+(?:src\.)?infrastructure",
+        "module": "infrastructure",
         "in_layer": "domain",
         "message": "Domain layer cannot import infrastructure layer",
     },
     {
-        "pattern": r"from\s+(?:src\.)?api\.",
+        "module": "api",
         "in_layer": "domain",
         "message": "Domain layer cannot import API layer",
     },
     {
-        "pattern": r"from\s+(?:src\.)?infrastructure\.",
+        "module": "infrastructure",
         "in_layer": "application",
         "message": "Application layer cannot import infrastructure layer",
     },
@@ -73,33 +74,106 @@ LAYER_PATHS: Dict[str, Path] = {
 # VALIDATION LOGIC (customize as needed)
 # ==============================================================================
 
+# Directories never descended into when walking a layer (caches, virtualenvs, VCS)
+SKIP_DIR_NAMES: Set[str] = {"__pycache__", ".venv", "venv", "node_modules", ".git"}
+
+# Import statements found by text search, for files that do not parse
+IMPORT_STATEMENT_PATTERN = re.compile(
+    r"(?<![\w.])(?:from[ \t]+(?P<package>[\w.]+)[ \t]+import[ \t]+(?P<names>[^#;\n]+)"
+    r"|import[ \t]+(?P<modules>[^#;\n]+))"
+)
+
+
+def iter_layer_files(layer_path: Path) -> Iterator[Path]:
+    """Yield the .py files of a layer (except __init__.py), pruning SKIP_DIR_NAMES."""
+    for root, dirs, files in os.walk(layer_path):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIR_NAMES]
+        for name in files:
+            if name.endswith(".py") and name != "__init__.py":
+                yield Path(root, name)
+
+
+@lru_cache(maxsize=None)
+def scan_file(file_path: Path) -> List[str]:
+    """
+    Return the absolute module names a file imports.
+
+    The file is read and parsed once per run (both checks share the result).
+    `from a.b import c` is recorded as "a.b.c"; relative imports are ignored.
+    Files that do not parse are searched for import statements as text instead.
+    """
+    try:
+        tree = ast.parse(file_path.read_bytes(), filename=str(file_path))
+    except (SyntaxError, ValueError):
+        return scan_text(file_path.read_text(errors="replace"))
+
+    modules = []
+    # Imports are statements: walk statement bodies, skipping expressions
+    pending = [tree]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.module and not node.level:
+                modules.extend(f"{node.module}.{alias.name}" for alias in node.names)
+        else:
+            pending.extend(
+                child for child in reversed(list(ast.iter_child_nodes(node)))
+                if not isinstance(child, ast.expr)
+            )
+
+    return modules
+
+
+def scan_text(content: str) -> List[str]:
+    """Return the absolute module names imported by source text, in scan_file's form."""
+    modules = []
+    for match in IMPORT_STATEMENT_PATTERN.finditer(content):
+        package = match["package"]
+        names = match["names"] if package else match["modules"]
+        if package and package.startswith("."):
+            continue
+        for name in names.strip(" \t()\\").split(","):
+            words = name.split()  # drops "as alias"
+            if words:
+                modules.append(f"{package}.{words[0]}" if package else words[0])
+    return modules
+
+
+def imports_from(modules: List[str], package: str) -> List[str]:
+    """Return the modules that are `package` or inside it (with or without src.)."""
+    prefixes = (f"{package}.", f"src.{package}.")
+    return [
+        module for module in modules
+        if module in (package, f"src.{package}") or module.startswith(prefixes)
+    ]
+
 
 def check_forbidden_patterns() -> List[Dict[str, str]]:
     """Check for forbidden import patterns in each layer."""
     violations = []
+    cwd_str = os.getcwd()
 
     for forbidden in FORBIDDEN_PATTERNS:
         layer = forbidden["in_layer"]
-        pattern = forbidden["pattern"]
-        message = forbidden["message"]
-
         layer_path = LAYER_PATHS.get(layer)
         if not layer_path or not layer_path.exists():
             continue
 
-        for file_path in layer_path.rglob("*.py"):
-            if file_path.name == "__init__.py":
-                continue
-
-            content = file_path.read_text()
-            matches = re.findall(pattern, content)
+        for file_path in iter_layer_files(layer_path):
+            if "module" in forbidden:
+                matches = imports_from(scan_file(file_path), forbidden["module"])
+            else:
+                # Legacy regex entry
+                matches = re.findall(forbidden["pattern"], file_path.read_text(errors="replace"))
 
             if matches:
                 violations.append(
                     {
-                        "file": str(file_path.relative_to(Path.cwd())),
+                        "file": os.path.relpath(os.fspath(file_path), cwd_str),
                         "layer": layer,
-                        "violation": message,
+                        "violation": forbidden["message"],
                         "imports": matches,
                     }
                 )
@@ -110,17 +184,15 @@ def check_forbidden_patterns() -> List[Dict[str, str]]:
 def check_layer_dependencies() -> List[Dict[str, str]]:
     """Check that layers only import from allowed dependency layers."""
     violations = []
+    cwd_str = os.getcwd()
 
     for layer, allowed_deps in LAYER_DEPENDENCIES.items():
         layer_path = LAYER_PATHS.get(layer)
         if not layer_path or not layer_path.exists():
             continue
 
-        for file_path in layer_path.rglob("*.py"):
-            if file_path.name == "__init__.py":
-                continue
-
-            content = file_path.read_text()
+        for file_path in iter_layer_files(layer_path):
+            modules = scan_file(file_path)
 
             # Check imports from other layers
             for other_layer, other_path in LAYER_PATHS.items():
@@ -129,13 +201,12 @@ def check_layer_dependencies() -> List[Dict[str, str]]:
 
                 if other_layer not in allowed_deps:
                     # Check for imports from forbidden layer
-                    pattern = rf"from\s+(?:src\.)?{other_layer}\.|import\s+(?:src\.)?{other_layer}"
-                    matches = re.findall(pattern, content)
+                    matches = imports_from(modules, other_layer)
 
                     if matches:
                         violations.append(
                             {
-                                "file": str(file_path.relative_to(Path.cwd())),
+                                "file": os.path.relpath(os.fspath(file_path), cwd_str),
                                 "layer": layer,
                                 "violation": f"{layer} layer cannot depend on {other_layer} layer",
                                 "imports": matches,
@@ -19,12 +19,26 @@ EXAMPLES:
 This is a TEMPLATE - adapt it to your project's needs.
 """
 
+import hashlib
+import heapq
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set, Any
+from typing import Dict, Iterator, List, Set, Any
 import re
 import json
 
+# Optional YAML support (only needed for OpenAPI YAML specs)
+try:
+    import yaml
+
+    # libyaml's C loader when PyYAML was built with it; it reads the raw bytes
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ImportError:
+    yaml = None
+
 # ==============================================================================
 # CUSTOMIZE THESE FOR YOUR PROJECT
 # ==============================================================================
@@ -52,30 +66,129 @@ ENABLE_MODEL_VALIDATION = False
 # VALIDATION LOGIC (customize as needed)
 # ==============================================================================
 
+# Route decorators, compiled once: Flask @app.route('/path') and FastAPI
+# @app.get('/path'), @app.post('/path'), etc. in a single pass over each file.
+# Matched against the raw bytes; only the captured paths are decoded.
+ENDPOINT_PATTERN = re.compile(
+    rb'@app\.(?:route|get|post|put|delete|patch)\(["\']([^"\']+)["\']'
+)
+
+# Directories never descended into when scanning source code (VCS, caches,
+# virtualenvs, build output)
+SKIP_DIR_NAMES: Set[str] = {
+    ".git", "__pycache__", ".venv", "venv", "node_modules", ".tox", "build", "dist",
+}
 
-def load_openapi_spec() -> Dict[str, Any] | None:
-    """Load OpenAPI specification from YAML or JSON."""
-    # Try YAML first
-    yaml_path = CONTRACT_FILES.get("openapi")
-    if yaml_path and yaml_path.exists():
-        try:
-            import yaml
 
-            return yaml.safe_load(yaml_path.read_text())
-        except ImportError:
-            print("⚠️  PyYAML not installed - cannot parse OpenAPI YAML")
-            print("   Install: pip install pyyaml")
-        except Exception as e:
-            print(f"⚠️  Failed to parse OpenAPI YAML: {e}")
+def iter_source_files(source_dir: Path) -> Iterator[Path]:
+    """Yield the .py files under source_dir, pruning SKIP_DIR_NAMES."""
+    for root, dirs, files in os.walk(source_dir):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIR_NAMES]
+        for name in files:
+            if name.endswith(".py"):
+                yield Path(root, name)
+
+
+# Above this many API files, endpoint scanning is spread over worker processes
+# (below it, worker start-up would cost more than it saves)
+PARALLEL_MIN_FILES = 200
+
+
+def scan_routes(file_path: Path) -> List[str]:
+    """Return the route paths declared in one source file."""
+    return [
+        route.decode("utf-8", "replace")
+        for route in ENDPOINT_PATTERN.findall(file_path.read_bytes())
+    ]
+
+
+# Parsed OpenAPI YAML, stored as JSON so later runs skip YAML parsing. An entry is
+# reused as-is while the YAML's mtime and size match, and after a re-hash while its
+# sha256 matches. Relative to the project root like CONTRACT_FILES; its directory
+# carries its own .gitignore so `git add .` never commits it.
+SPEC_CACHE_FILE = Path(".tier1_cache/openapi.json")
+
+
+def _read_spec_cache(source: str) -> Dict[str, Any] | None:
+    """Return the cache entry for this source (None on a miss)."""
+    try:
+        cache = json.loads(SPEC_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get("source") != source:
+        return None
+    return cache
+
+
+def _write_spec_cache(source: str, digest: str, mtime_ns: int, size: int, spec: Any) -> Any:
+    """
+    Store a parsed spec in the cache and return its JSON form.
+
+    The JSON form (string keys, dates as strings) is returned even on the run that
+    fills the cache, so a spec looks the same whether it was parsed or cached.
+    """
+    text = json.dumps(
+        {"source": source, "sha256": digest, "mtime_ns": mtime_ns, "size": size, "spec": spec},
+        default=str,
+    )
+    try:
+        SPEC_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        gitignore = SPEC_CACHE_FILE.parent / ".gitignore"
+        if not gitignore.exists():
+            gitignore.write_text("# Automatically created by validate_contracts.py\n*\n")
+        tmp_path = SPEC_CACHE_FILE.with_suffix(".json.tmp")
+        tmp_path.write_text(text)
+        os.replace(tmp_path, SPEC_CACHE_FILE)
+    except OSError:
+        pass  # Cache is best-effort
+    return json.loads(text)["spec"]
+
+
+@lru_cache(maxsize=4)
+def _load_openapi_yaml(path: str, mtime_ns: int, size: int) -> Dict[str, Any] | None:
+    """
+    Parse an OpenAPI YAML file.
+
+    Memoized per (path, mtime, size) within a process, so an edit invalidates it;
+    across processes the parse is reused from the spec cache file. Callers must not
+    modify the returned spec.
+    """
+    cache = _read_spec_cache(path)
+    if cache and cache.get("mtime_ns") == mtime_ns and cache.get("size") == size:
+        return cache.get("spec")  # Untouched since cached: the YAML is not even read
+
+    data = Path(path).read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    if cache and cache.get("sha256") == digest:
+        spec = cache.get("spec")  # Touched but unchanged: refresh the stat key
+    else:
+        spec = yaml.load(data, Loader=_YAML_LOADER)
+    return _write_spec_cache(path, digest, mtime_ns, size, spec)
+
 
-    # Try JSON
+def load_openapi_spec() -> Dict[str, Any] | None:
+    """Load OpenAPI specification from JSON or YAML."""
+    # Try JSON first (much faster to parse than YAML)
     json_path = CONTRACT_FILES.get("openapi_json")
     if json_path and json_path.exists():
         try:
-            return json.loads(json_path.read_text())
+            return json.loads(json_path.read_bytes())
         except Exception as e:
             print(f"⚠️  Failed to parse OpenAPI JSON: {e}")
 
+    # Then YAML (converted to JSON once, see SPEC_CACHE_FILE)
+    yaml_path = CONTRACT_FILES.get("openapi")
+    if yaml_path and yaml_path.exists():
+        if yaml is None:
+            print("⚠️  PyYAML not installed - cannot parse OpenAPI YAML")
+            print("   Install: pip install pyyaml")
+            return None
+        try:
+            st = yaml_path.stat()
+            return _load_openapi_yaml(str(yaml_path), st.st_mtime_ns, st.st_size)
+        except Exception as e:
+            print(f"⚠️  Failed to parse OpenAPI YAML: {e}")
+
     return None
 
 
@@ -94,18 +207,14 @@ def extract_api_endpoints_from_code() -> Set[str]:
     if not API_DIR.exists():
         return endpoints
 
-    for file_path in API_DIR.rglob("*.py"):
-        content = file_path.read_text()
-
-        # Flask pattern: @app.route('/path')
-        flask_routes = re.findall(r'@app\.route\(["\']([^"\']+)["\']', content)
-        endpoints.update(flask_routes)
-
-        # FastAPI pattern: @app.get('/path'), @app.post('/path'), etc.
-        fastapi_routes = re.findall(
-            r'@app\.(?:get|post|put|delete|patch)\(["\']([^"\']+)["\']', content
-        )
-        endpoints.update(fastapi_routes)
+    files = list(iter_source_files(API_DIR))
+    if len(files) > PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            for routes in executor.map(scan_routes, files, chunksize=32):
+                endpoints.update(routes)
+    else:
+        for file_path in files:
+            endpoints.update(scan_routes(file_path))
 
     return endpoints
 
@@ -134,7 +243,7 @@ def validate_openapi_contracts() -> List[Dict[str, str]]:
             {
                 "type": "openapi",
                 "issue": "Endpoints defined in spec but not implemented in code",
-                "endpoints": list(missing_in_code),
+                "endpoints": missing_in_code,
             }
         )
 
@@ -143,7 +252,7 @@ def validate_openapi_contracts() -> List[Dict[str, str]]:
             {
                 "type": "openapi",
                 "issue": "Endpoints implemented in code but not defined in spec",
-                "endpoints": list(missing_in_spec),
+                "endpoints": missing_in_spec,
             }
         )
 
@@ -240,36 +349,61 @@ def print_violations(violations: List[Dict[str, Any]]) -> None:
         print(f"   Issue: {v['issue']}")
         if "endpoints" in v and v["endpoints"]:
             print(f"   Endpoints:")
-            for endpoint in v["endpoints"][:5]:
+            # Endpoints are kept as a set; only the five shown are ordered
+            for endpoint in heapq.nsmallest(5, v["endpoints"]):
                 print(f"     - {endpoint}")
             if len(v["endpoints"]) > 5:
                 print(f"     ... and {len(v['endpoints']) - 5} more")
         print()
 
 
+def contracts_present() -> Dict[str, bool]:
+    """Which contract sources exist (one stat each), keyed like the ENABLE_* flags."""
+    present = {
+        key: bool(path and path.exists()) for key, path in CONTRACT_FILES.items()
+    }
+    return {
+        "openapi": present.get("openapi", False) or present.get("openapi_json", False),
+        "graphql": present.get("graphql", False),
+        "proto": present.get("proto", False),
+        "model": MODELS_DIR.exists(),
+    }
+
+
 def main() -> int:
     """Run contract validation."""
+    present = contracts_present()
+    run_openapi = ENABLE_OPENAPI_VALIDATION and present["openapi"]
+    run_graphql = ENABLE_GRAPHQL_VALIDATION and present["graphql"]
+    run_proto = ENABLE_PROTO_VALIDATION and present["proto"]
+    run_model = ENABLE_MODEL_VALIDATION and present["model"]
+
+    # Nothing enabled has a contract to check against
+    if not (run_openapi or run_graphql or run_proto or run_model):
+        print("ℹ️  No contract files found - skipping contract validation")
+        return 0
+
     print("🔍 Running contract validation...\n")
 
     all_violations = []
 
-    # Run enabled validations
-    if ENABLE_OPENAPI_VALIDATION:
+    # Run enabled validations (only those whose contract files exist)
+    if run_openapi:
         print("Checking OpenAPI contracts...")
         openapi_violations = validate_openapi_contracts()
         all_violations.extend(openapi_violations)
 
-    if ENABLE_GRAPHQL_VALIDATION:
+    if run_graphql:
         print("Checking GraphQL contracts...")
         graphql_violations = validate_graphql_contracts()
         all_violations.extend(graphql_violations)
 
-    if ENABLE_PROTO_VALIDATION:
+    if run_proto:
         print("Checking gRPC proto contracts...")
         proto_violations = validate_proto_contracts()
         all_violations.extend(proto_violations)
 
-    if ENABLE_MODEL_VALIDATION:
+    if run_model:
         print("Checking model contracts...")
         model_violations = validate_model_contracts()
         all_violations.extend(model_violations)
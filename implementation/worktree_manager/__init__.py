@@ -46,7 +46,7 @@ Directory Structure:
     └── .metadata/                 # Metadata tracking
         ├── TASK-001-api-a3f2b1.json
         └── archived/              # Historical records
-            └── TASK-001-api-a3f2b1-20251019-143000.json
+            └── archived.jsonl
 """
 
 # Core worktree operations
@@ -71,7 +71,9 @@ from .cleanup import (
     cleanup_all_worktrees,
     cleanup_epic_worktrees,
     cleanup_worktree,
+    cleanup_worktrees,
     list_archived_worktrees,
+    migrate_legacy_archives,
 )
 
 # Data models
@@ -91,10 +93,12 @@ __all__ = [
     "get_all_git_worktrees",
     # Cleanup operations
     "cleanup_worktree",
+    "cleanup_worktrees",
     "cleanup_epic_worktrees",
     "archive_worktree_metadata",
     "cleanup_abandoned_worktrees",
     "list_archived_worktrees",
+    "migrate_legacy_archives",
     "cleanup_all_worktrees",
     # Models
     "WorktreeMetadata",
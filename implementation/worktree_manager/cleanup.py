@@ -1,19 +1,34 @@
 """Worktree cleanup and archival operations."""
 
 import logging
+import os
 import shutil
 import subprocess
-from datetime import datetime, timedelta
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from operator import attrgetter
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from pydantic import TypeAdapter, ValidationError
 
 from .models import WorktreeMetadata
-from .worktree_manager import METADATA_DIR, get_worktree_metadata, list_worktrees, load_metadata_from_file
+from .worktree_manager import METADATA_DIR, get_worktree_metadata, list_worktrees
 
 logger = logging.getLogger(__name__)
 
 # Archive directory for historical metadata
 ARCHIVE_DIR = METADATA_DIR / "archived"
 
+# Append-only archive log: one JSON object per line
+ARCHIVE_LOG = ARCHIVE_DIR / "archived.jsonl"
+
+# Validates the whole archive log in one call
+_ARCHIVE_ADAPTER = TypeAdapter(List[WorktreeMetadata])
+
+# Worker threads for migrating legacy per-file archives (file reads are I/O bound)
+ARCHIVE_LOAD_WORKERS = 8
+
 
 def cleanup_worktree(worktree_name: str, delete_branch: bool = False, force: bool = False) -> None:
     """Remove worktree and optionally delete branch.
@@ -33,22 +48,64 @@ def cleanup_worktree(worktree_name: str, delete_branch: bool = False, force: boo
         >>> # Force cleanup of failed worktree
         >>> cleanup_worktree("EPIC-007-broken-a3f2b1", force=True)
     """
-    metadata = get_worktree_metadata(worktree_name)
-    if not metadata:
-        logger.warning(f"Metadata not found for {worktree_name}")
-        return
+    failures = cleanup_worktrees([worktree_name], delete_branches=delete_branch, force=force)
+    if worktree_name in failures:
+        raise failures[worktree_name]
+
+
+def cleanup_worktrees(
+    worktree_names: List[str], delete_branches: bool = False, force: bool = False
+) -> Dict[str, Exception]:
+    """Remove several worktrees and optionally delete their branches.
 
-    # Check if worktree is in terminal state
+    Same checks and steps as cleanup_worktree for each worktree, but all feature
+    branches are deleted by one `git branch` call instead of one per worktree.
+    Each directory is still removed with its own `git worktree remove`
+    (`--force` when force=True, falling back to deleting the directory if git
+    refuses); directories that no longer exist need no git call.
+
+    Args:
+        worktree_names: Worktree names
+        delete_branches: Delete feature branches after removing worktrees
+        force: Force removal even if worktrees have uncommitted changes
+
+    Returns:
+        Errors keyed by the name of each worktree that could not be cleaned up
+        (empty if all succeeded)
+
+    Example:
+        >>> failures = cleanup_worktrees(["EPIC-007-api-a3f2b1", "EPIC-007-ui-b4c3d2"], delete_branches=True)
+        >>> for name, error in failures.items():
+        ...     print(f"{name}: {error}")
+    """
+    failures: Dict[str, Exception] = {}
     terminal_states = ["completed", "merged", "failed", "cleaned"]
-    if metadata.status not in terminal_states and not force:
-        raise ValueError(
-            f"Worktree {worktree_name} is in state '{metadata.status}'. Use force=True to cleanup non-terminal state."
-        )
 
-    logger.info(f"Cleaning up worktree: {worktree_name}")
+    worktrees: List[WorktreeMetadata] = []
+    for worktree_name in worktree_names:
+        metadata = get_worktree_metadata(worktree_name)
+        if not metadata:
+            logger.warning(f"Metadata not found for {worktree_name}")
+            continue
+
+        # Check if worktree is in terminal state
+        if metadata.status not in terminal_states and not force:
+            failures[worktree_name] = ValueError(
+                f"Worktree {worktree_name} is in state '{metadata.status}'. Use force=True to cleanup non-terminal state."
+            )
+            continue
+
+        logger.info(f"Cleaning up worktree: {worktree_name}")
+        worktrees.append(metadata)
+
+    # Remove worktree directories
+    removed: List[WorktreeMetadata] = []
+    for metadata in worktrees:
+        if not metadata.path.exists():
+            logger.warning(f"Worktree directory does not exist: {metadata.path}")
+            removed.append(metadata)
+            continue
 
-    # Remove worktree directory
-    if metadata.path.exists():
         try:
             force_flag = ["--force"] if force else []
             subprocess.run(
@@ -61,41 +118,91 @@ def cleanup_worktree(worktree_name: str, delete_branch: bool = False, force: boo
         except subprocess.CalledProcessError as e:
             logger.error(f"Failed to remove worktree: {e.stderr}")
             if not force:
-                raise
+                failures[metadata.name] = e
+                continue
             # If force=True, try manual directory removal
             logger.warning("Attempting manual directory removal...")
             try:
                 shutil.rmtree(metadata.path)
                 logger.info(f"✅ Manually removed directory: {metadata.path}")
-            except Exception as rm_error:
+            except OSError as rm_error:
                 logger.error(f"Failed to manually remove directory: {rm_error}")
-                raise
-    else:
-        logger.warning(f"Worktree directory does not exist: {metadata.path}")
+                failures[metadata.name] = rm_error
+                continue
+        removed.append(metadata)
 
-    # Delete feature branch if requested
-    if delete_branch:
-        try:
+    # Delete feature branches if requested (one call for all of them)
+    if delete_branches and removed:
+        branches = list(dict.fromkeys(metadata.branch for metadata in removed))
+        existing = _existing_branches(branches)
+        to_delete = [branch for branch in branches if branch in existing]
+        failed_branches = {branch: f"branch '{branch}' not found" for branch in branches if branch not in existing}
+
+        if to_delete:
             force_flag = "-D" if force else "-d"
-            subprocess.run(["git", "branch", force_flag, metadata.branch], check=True, capture_output=True, text=True)
-            logger.info(f"✅ Deleted branch: {metadata.branch}")
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to delete branch: {e.stderr}")
-            if not force:
-                raise
+            result = subprocess.run(["git", "branch", force_flag, *to_delete], capture_output=True, text=True)
+            if result.returncode != 0:
+                # git deletes what it can; the branches still present are the ones that failed
+                remaining = _existing_branches(to_delete)
+                for branch in to_delete:
+                    if branch in remaining:
+                        errors = [line for line in result.stderr.splitlines() if f"'{branch}'" in line]
+                        failed_branches[branch] = "\n".join(errors) or result.stderr
+
+        for branch in branches:
+            if branch in failed_branches:
+                logger.error(f"Failed to delete branch: {failed_branches[branch]}")
+            else:
+                logger.info(f"✅ Deleted branch: {branch}")
+
+        if not force:
+            failed_removed = [metadata for metadata in removed if metadata.branch in failed_branches]
+            for metadata in failed_removed:
+                failures[metadata.name] = RuntimeError(
+                    f"Failed to delete branch {metadata.branch}: {failed_branches[metadata.branch]}"
+                )
+            removed = [metadata for metadata in removed if metadata.branch not in failed_branches]
+
+    # Fold any legacy per-file archives into the log before appending to it
+    if removed:
+        try:
+            migrate_legacy_archives()
+        except OSError as e:
+            logger.warning(f"Failed to migrate legacy archives: {e}")
+
+    # One clock reading for the batch (metadata timestamps are naive UTC)
+    cleaned_at = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    for metadata in removed:
+        # Archive metadata
+        metadata.status = "cleaned"  # type: ignore
+        metadata.cleaned_at = cleaned_at
+        try:
+            archive_worktree_metadata(metadata)
+        except Exception as e:
+            failures[metadata.name] = e
+            continue
+
+        # Remove active metadata file
+        metadata_file = METADATA_DIR / f"{metadata.name}.json"
+        if metadata_file.exists():
+            metadata_file.unlink()
+            logger.info(f"✅ Removed metadata file: {metadata_file}")
 
-    # Archive metadata
-    metadata.status = "cleaned"  # type: ignore
-    metadata.cleaned_at = datetime.utcnow()
-    archive_worktree_metadata(metadata)
+        logger.info(f"✅ Cleanup complete for {metadata.name}")
 
-    # Remove active metadata file
-    metadata_file = METADATA_DIR / f"{worktree_name}.json"
-    if metadata_file.exists():
-        metadata_file.unlink()
-        logger.info(f"✅ Removed metadata file: {metadata_file}")
+    return failures
 
-    logger.info(f"✅ Cleanup complete for {worktree_name}")
+
+def _existing_branches(branches: List[str]) -> Set[str]:
+    """Return which of the given local branches exist (one git call)."""
+    result = subprocess.run(
+        ["git", "for-each-ref", "--format=%(refname)", *(f"refs/heads/{branch}" for branch in branches)],
+        capture_output=True,
+        text=True,
+    )
+    refs = {line[len("refs/heads/"):] for line in result.stdout.splitlines()}
+    return refs.intersection(branches)
 
 
 def cleanup_epic_worktrees(epic_id: str, delete_branches: bool = False) -> int:
@@ -127,15 +234,11 @@ def cleanup_epic_worktrees(epic_id: str, delete_branches: bool = False) -> int:
 
     logger.info(f"Found {len(cleanable_worktrees)} worktrees to cleanup")
 
-    cleaned_count = 0
-    for worktree in cleanable_worktrees:
-        try:
-            cleanup_worktree(worktree.name, delete_branch=delete_branches)
-            cleaned_count += 1
-        except Exception as e:
-            logger.error(f"Failed to cleanup {worktree.name}: {e}")
-            continue
+    failures = cleanup_worktrees([wt.name for wt in cleanable_worktrees], delete_branches=delete_branches)
+    for name, error in failures.items():
+        logger.error(f"Failed to cleanup {name}: {error}")
 
+    cleaned_count = len(cleanable_worktrees) - len(failures)
     logger.info(f"✅ Cleaned up {cleaned_count}/{len(cleanable_worktrees)} worktrees")
     return cleaned_count
 
@@ -143,7 +246,7 @@ def cleanup_epic_worktrees(epic_id: str, delete_branches: bool = False) -> int:
 def archive_worktree_metadata(metadata: WorktreeMetadata) -> None:
     """Move metadata to archived directory for historical record.
 
-    Creates .worktrees/.metadata/archived/{name}.json
+    Appends one line to .worktrees/.metadata/archived/archived.jsonl
 
     Args:
         metadata: WorktreeMetadata to archive
@@ -155,23 +258,32 @@ def archive_worktree_metadata(metadata: WorktreeMetadata) -> None:
     # Ensure archive directory exists
     ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Create archive filename with timestamp
-    timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
-    archive_filename = f"{metadata.name}-{timestamp}.json"
-    archive_path = ARCHIVE_DIR / archive_filename
-
-    # Save to archive
-    import json
-
+    # Save to archive (single write of one compact line)
     try:
-        with open(archive_path, "w") as f:
-            json.dump(metadata.model_dump(mode="json"), f, indent=2, default=str)
-        logger.info(f"✅ Archived metadata: {archive_path}")
+        _append_to_archive_log(metadata.model_dump_json().encode() + b"\n")
+        logger.info(f"✅ Archived metadata: {metadata.name} -> {ARCHIVE_LOG}")
     except Exception as e:
         logger.error(f"Failed to archive metadata: {e}")
         raise
 
 
+def _append_to_archive_log(records: bytes, sync: bool = False) -> None:
+    """Append newline-terminated records to ARCHIVE_LOG in one write.
+
+    If the log ends in a torn line (an earlier write cut short), a newline is
+    written first so the torn line does not swallow the first new record.
+    """
+    with open(ARCHIVE_LOG, "a+b") as f:
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                records = b"\n" + records
+        f.write(records)
+        if sync:
+            f.flush()
+            os.fsync(f.fileno())
+
+
 def cleanup_abandoned_worktrees(max_age_days: int = 7) -> int:
     """Cleanup worktrees that have been inactive for > max_age_days.
 
@@ -188,22 +300,21 @@ def cleanup_abandoned_worktrees(max_age_days: int = 7) -> int:
     """
     logger.info(f"Checking for abandoned worktrees (max age: {max_age_days} days)")
 
-    cutoff_date = datetime.utcnow() - timedelta(days=max_age_days)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)  # metadata timestamps are naive UTC
+    cutoff_date = now - timedelta(days=max_age_days)
 
     # Get all worktrees in non-terminal states
     all_worktrees = list_worktrees()
-    non_terminal_states = ["created", "assigned", "in_progress"]
-
-    abandoned_worktrees = []
-    for wt in all_worktrees:
-        if wt.status not in non_terminal_states:
-            continue
-
-        # Check age based on created_at or last updated timestamp
-        check_date = wt.completed_at or wt.assigned_at or wt.created_at
+    non_terminal_states = ("created", "assigned", "in_progress")
 
-        if check_date < cutoff_date:
-            abandoned_worktrees.append(wt)
+    # Check age based on the latest lifecycle timestamp set (completed, assigned, created)
+    lifecycle_dates = attrgetter("completed_at", "assigned_at", "created_at")
+    abandoned_worktrees = [
+        wt
+        for wt in all_worktrees
+        if wt.status in non_terminal_states
+        and next(date for date in lifecycle_dates(wt) if date is not None) < cutoff_date
+    ]
 
     if not abandoned_worktrees:
         logger.info("No abandoned worktrees found")
@@ -211,30 +322,112 @@ def cleanup_abandoned_worktrees(max_age_days: int = 7) -> int:
 
     logger.warning(f"Found {len(abandoned_worktrees)} abandoned worktrees")
 
-    cleaned_count = 0
     for worktree in abandoned_worktrees:
         logger.warning(
-            f"Cleaning abandoned worktree: {worktree.name} (age: {(datetime.utcnow() - worktree.created_at).days} days)"
+            f"Cleaning abandoned worktree: {worktree.name} (age: {(now - worktree.created_at).days} days)"
         )
-        try:
-            cleanup_worktree(worktree.name, delete_branch=True, force=True)
-            cleaned_count += 1
-        except Exception as e:
-            logger.error(f"Failed to cleanup abandoned worktree {worktree.name}: {e}")
-            continue
 
+    failures = cleanup_worktrees([wt.name for wt in abandoned_worktrees], delete_branches=True, force=True)
+    for name, error in failures.items():
+        logger.error(f"Failed to cleanup abandoned worktree {name}: {error}")
+
+    cleaned_count = len(abandoned_worktrees) - len(failures)
     logger.info(f"✅ Cleaned up {cleaned_count}/{len(abandoned_worktrees)} abandoned worktrees")
     return cleaned_count
 
 
+def _load_archived_metadata(archive_file: Path) -> Optional[WorktreeMetadata]:
+    """Load one legacy archive file, or None (logged) if it cannot be parsed."""
+    try:
+        return WorktreeMetadata.model_validate_json(archive_file.read_bytes())
+    except Exception as e:
+        logger.warning(f"Failed to load archived metadata from {archive_file}: {e}")
+        return None
+
+
+def _archive_key(metadata: WorktreeMetadata) -> tuple:
+    """Identity of an archive entry (the same worktree is archived once per cleanup)."""
+    return (metadata.name, metadata.cleaned_at)
+
+
+def _load_legacy_archives() -> List[Tuple[Path, WorktreeMetadata]]:
+    """Load legacy per-file archives ({name}-{timestamp}.json); unparsable files are skipped."""
+    legacy_files = list(ARCHIVE_DIR.glob("*.json"))
+    if not legacy_files:
+        return []
+
+    with ThreadPoolExecutor(max_workers=ARCHIVE_LOAD_WORKERS) as executor:
+        loaded = list(executor.map(_load_archived_metadata, legacy_files))
+    return [(path, metadata) for path, metadata in zip(legacy_files, loaded, strict=True) if metadata is not None]
+
+
+def migrate_legacy_archives() -> int:
+    """Move legacy per-file archives ({name}-{timestamp}.json) into ARCHIVE_LOG.
+
+    Entries already in the log are not appended again, so a migration that was
+    interrupted between appending and deleting the files (or that ran twice
+    concurrently) is safe to repeat. The log is only ever appended to, never
+    rewritten, so concurrent archive_worktree_metadata calls are not lost.
+    Files that cannot be parsed are left in place. Called by cleanup_worktrees
+    before it archives anything.
+
+    Returns:
+        Number of legacy files migrated
+    """
+    if not ARCHIVE_DIR.exists():
+        return 0
+
+    legacy = _load_legacy_archives()
+    if not legacy:
+        return 0
+
+    logged = {_archive_key(metadata) for metadata in _read_archive_log()} if ARCHIVE_LOG.exists() else set()
+    pending: Dict[tuple, WorktreeMetadata] = {}
+    for _, metadata in legacy:
+        key = _archive_key(metadata)
+        if key not in logged:
+            pending.setdefault(key, metadata)
+
+    if pending:
+        _append_to_archive_log(
+            b"".join(metadata.model_dump_json().encode() + b"\n" for metadata in pending.values()), sync=True
+        )
+    for path, _ in legacy:
+        path.unlink(missing_ok=True)
+
+    logger.info(f"Migrated {len(legacy)} legacy archive files to {ARCHIVE_LOG}")
+    return len(legacy)
+
+
+def _read_archive_log() -> List[WorktreeMetadata]:
+    """Validate every line of ARCHIVE_LOG, skipping (and logging) bad lines."""
+    lines = [line for line in ARCHIVE_LOG.read_bytes().splitlines() if line.strip()]
+    try:
+        # Fast path: the whole log as one JSON array in a single validation call
+        return _ARCHIVE_ADAPTER.validate_json(b"[" + b",".join(lines) + b"]")
+    except ValidationError:
+        pass
+
+    archived_worktrees = []
+    for line_number, line in enumerate(lines, 1):
+        try:
+            archived_worktrees.append(WorktreeMetadata.model_validate_json(line))
+        except ValidationError as e:
+            logger.warning(f"Failed to load archived metadata from {ARCHIVE_LOG} (entry {line_number}): {e}")
+    return archived_worktrees
+
+
 def list_archived_worktrees(epic_id: Optional[str] = None) -> list:
     """List archived worktree metadata.
 
+    Read-only: entries come from the archive log plus any legacy per-file
+    archives not yet migrated (see migrate_legacy_archives), each entry once.
+
     Args:
         epic_id: Filter by epic (optional)
 
     Returns:
-        List of WorktreeMetadata from archived files
+        List of WorktreeMetadata from the archive
 
     Example:
         >>> archived = list_archived_worktrees(epic_id="EPIC-007")
@@ -243,20 +436,17 @@ def list_archived_worktrees(epic_id: Optional[str] = None) -> list:
     if not ARCHIVE_DIR.exists():
         return []
 
-    archived_worktrees = []
+    entries = _read_archive_log() if ARCHIVE_LOG.exists() else []
+    entries.extend(metadata for _, metadata in _load_legacy_archives())
 
-    for archive_file in ARCHIVE_DIR.glob("*.json"):
-        try:
-            metadata = load_metadata_from_file(archive_file)
+    # One entry per (name, cleaned_at), e.g. after an interrupted migration
+    unique = {}
+    for metadata in entries:
+        unique.setdefault(_archive_key(metadata), metadata)
+    archived_worktrees = list(unique.values())
 
-            # Apply filter
-            if epic_id and metadata.epic_id != epic_id:
-                continue
-
-            archived_worktrees.append(metadata)
-        except Exception as e:
-            logger.warning(f"Failed to load archived metadata from {archive_file}: {e}")
-            continue
+    if epic_id:
+        archived_worktrees = [metadata for metadata in archived_worktrees if metadata.epic_id == epic_id]
 
     # Sort by archived date (most recent first)
     archived_worktrees.sort(key=lambda w: w.cleaned_at or w.completed_at or w.created_at, reverse=True)
@@ -290,16 +480,14 @@ def cleanup_all_worktrees(include_active: bool = False, delete_branches: bool =
 
     logger.info(f"Cleaning {len(worktrees_to_clean)} worktrees")
 
-    cleaned = 0
-    failed = 0
+    failures = cleanup_worktrees(
+        [wt.name for wt in worktrees_to_clean], delete_branches=delete_branches, force=include_active
+    )
+    for name, error in failures.items():
+        logger.error(f"Failed to cleanup {name}: {error}")
 
-    for worktree in worktrees_to_clean:
-        try:
-            cleanup_worktree(worktree.name, delete_branch=delete_branches, force=include_active)
-            cleaned += 1
-        except Exception as e:
-            logger.error(f"Failed to cleanup {worktree.name}: {e}")
-            failed += 1
+    failed = len(failures)
+    cleaned = len(worktrees_to_clean) - failed
 
     stats = {"total": len(worktrees_to_clean), "cleaned": cleaned, "failed": failed}
 
@@ -4,7 +4,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class WorktreeMetadata(BaseModel):
@@ -39,10 +39,8 @@ class WorktreeMetadata(BaseModel):
     commits: List[str] = Field(default_factory=list, description="Commit hashes created in worktree")
     error_message: Optional[str] = Field(default=None, description="Error details if status='failed'")
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {Path: str, datetime: lambda v: v.isoformat() if v else None}
+    # Path and datetime already serialize to str / ISO 8601 in JSON mode
+    model_config = ConfigDict(extra="ignore")
 
 
 class MergeResult(BaseModel):
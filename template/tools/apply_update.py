@@ -12,6 +12,13 @@ Usage:
         --update-id agent-failure-reporting-protocol-v1 \\
         --component-index 0 \\
         [--dry-run]
+
+    # Component already resolved by the caller, passed as JSON on stdin
+    python apply_update.py \\
+        --project-path /path/to/project \\
+        --update-id agent-failure-reporting-protocol-v1 \\
+        --component-index 0 \\
+        --component-json - < component.json
 """
 
 import argparse
@@ -21,7 +28,7 @@ import shutil
 import subprocess
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, TextIO
 
 
 class UpdateApplier:
@@ -34,12 +41,22 @@ class UpdateApplier:
         update_id: str,
         component_index: int,
         dry_run: bool = False,
+        component: Optional[Dict[str, Any]] = None,
+        out: Optional[TextIO] = None,
     ):
         self.project_path = project_path
         self.update_definitions = update_definitions
         self.update_id = update_id
         self.component_index = component_index
         self.dry_run = dry_run
+        # Progress/warning stream (default: stderr; in-process callers pass their own buffer)
+        self.out = out if out is not None else sys.stderr
+
+        # Component already resolved by the caller (skips the definitions lookup)
+        if component is not None:
+            self.update_def = None
+            self.component = component
+            return
 
         # Find update definition
         self.update_def = self._find_update()
@@ -80,16 +97,18 @@ class UpdateApplier:
         check_cmd = check_cmd.replace("{target}", str(target_path))
 
         try:
+            # close_fds=False allows the posix_spawn fast path (fds are non-inheritable by default)
             result = subprocess.run(
                 check_cmd,
                 shell=True,
                 cwd=self.project_path,
                 capture_output=True,
                 text=True,
+                close_fds=False,
             )
             return result.returncode == 0
         except Exception as e:
-            print(f"Warning: Idempotent check failed with error: {e}", file=sys.stderr)
+            print(f"Warning: Idempotent check failed with error: {e}", file=self.out)
             return False
 
     def apply(self) -> Dict[str, Any]:
@@ -199,7 +218,7 @@ class UpdateApplier:
         section_content += "\n"
 
         if self.dry_run:
-            print(f"[DRY RUN] Would insert {len(section_content)} chars before line {marker_index}", file=sys.stderr)
+            print(f"[DRY RUN] Would insert {len(section_content)} chars before line {marker_index}", file=self.out)
             return
 
         # Insert section before marker
@@ -243,7 +262,7 @@ class UpdateApplier:
             content += "\n"
 
         if self.dry_run:
-            print(f"[DRY RUN] Would insert after line {pattern_index}: {content.strip()}", file=sys.stderr)
+            print(f"[DRY RUN] Would insert after line {pattern_index}: {content.strip()}", file=self.out)
             return
 
         # Insert after pattern line
@@ -302,7 +321,7 @@ class UpdateApplier:
         section_content += "\n"
 
         if self.dry_run:
-            print(f"[DRY RUN] Would insert {len(section_content)} chars before line {marker_index}", file=sys.stderr)
+            print(f"[DRY RUN] Would insert {len(section_content)} chars before line {marker_index}", file=self.out)
             return
 
         # Insert section before marker
@@ -338,7 +357,7 @@ class UpdateApplier:
         target_path.parent.mkdir(parents=True, exist_ok=True)
 
         if self.dry_run:
-            print(f"[DRY RUN] Would copy {source_path} to {target_path}", file=sys.stderr)
+            print(f"[DRY RUN] Would copy {source_path} to {target_path}", file=self.out)
             return
 
         # Copy file
@@ -385,7 +404,7 @@ class UpdateApplier:
             new_line += "\n"
 
         if self.dry_run:
-            print(f"[DRY RUN] Would replace line {match_index}: {old_line.strip()} -> {new_line.strip()}", file=sys.stderr)
+            print(f"[DRY RUN] Would replace line {match_index}: {old_line.strip()} -> {new_line.strip()}", file=self.out)
             return
 
         # Replace line
@@ -441,7 +460,7 @@ class UpdateApplier:
             content = content.replace(search, replace, 1)
 
         if self.dry_run:
-            print(f"[DRY RUN] Would apply {len(operations)} search-replace operations", file=sys.stderr)
+            print(f"[DRY RUN] Would apply {len(operations)} search-replace operations", file=self.out)
             return
 
         # Only write if content changed
@@ -475,7 +494,7 @@ class UpdateApplier:
         merged_data = self._deep_merge(existing_data, merge_data)
 
         if self.dry_run:
-            print(f"[DRY RUN] Would merge JSON data into {target_path}", file=sys.stderr)
+            print(f"[DRY RUN] Would merge JSON data into {target_path}", file=self.out)
             return
 
         # Write merged JSON
@@ -566,7 +585,7 @@ class UpdateApplier:
             replacement_content += "\n"
 
         if self.dry_run:
-            print(f"[DRY RUN] Would replace {end_index - start_index} chars between markers", file=sys.stderr)
+            print(f"[DRY RUN] Would replace {end_index - start_index} chars between markers", file=self.out)
             return
 
         # Replace section (keep start_marker, replace up to but not including end_marker)
@@ -630,7 +649,7 @@ class UpdateApplier:
         # Process each target file
         for target_path in target_paths:
             if not target_path.exists():
-                print(f"Warning: Target file not found (skipping): {target_path}", file=sys.stderr)
+                print(f"Warning: Target file not found (skipping): {target_path}", file=self.out)
                 continue
 
             # Read target file
@@ -652,7 +671,7 @@ class UpdateApplier:
                 if self.dry_run:
                     print(
                         f"[DRY RUN] Would remove {lines_removed} line(s) from {target_path.name}",
-                        file=sys.stderr
+                        file=self.out
                     )
                 else:
                     # Write back filtered content
@@ -661,11 +680,52 @@ class UpdateApplier:
 
                     print(
                         f"Removed {lines_removed} line(s) matching '{pattern}' from {target_path.name}",
-                        file=sys.stderr
+                        file=self.out
                     )
 
         if total_lines_removed == 0:
-            print(f"No lines matching pattern '{pattern}' found in target file(s)", file=sys.stderr)
+            print(f"No lines matching pattern '{pattern}' found in target file(s)", file=self.out)
+
+
+def apply_component(
+    project_path: Path,
+    update_definitions: Dict[str, Any],
+    update_id: str,
+    component_index: int,
+    dry_run: bool = False,
+    component: Optional[Dict[str, Any]] = None,
+    out: Optional[TextIO] = None,
+) -> Dict[str, Any]:
+    """
+    Apply a single update component in-process.
+
+    Used by main() and by deployers that import this module instead of
+    spawning one interpreter per component. If `component` is given it is
+    applied as-is and `update_definitions` is not consulted. Dry-run and
+    warning messages go to `out` (default: sys.stderr), so callers running
+    components on threads can keep each one's output in its own buffer.
+
+    Returns:
+        Result dictionary (same shape as the JSON printed by main())
+    """
+    try:
+        applier = UpdateApplier(
+            project_path=project_path,
+            update_definitions=update_definitions,
+            update_id=update_id,
+            component_index=component_index,
+            dry_run=dry_run,
+            component=component,
+            out=out,
+        )
+        return applier.apply()
+    except Exception as e:
+        return {
+            "status": "failure",
+            "update_id": update_id,
+            "component_index": component_index,
+            "error": str(e),
+        }
 
 
 def main() -> None:
@@ -682,8 +742,7 @@ def main() -> None:
     parser.add_argument(
         "--update-def",
         type=Path,
-        required=True,
-        help="Path to update_definitions.json",
+        help="Path to update_definitions.json (required unless --component-json is given)",
     )
     parser.add_argument(
         "--update-id",
@@ -702,49 +761,53 @@ def main() -> None:
         action="store_true",
         help="Preview mode (don't modify files)",
     )
+    parser.add_argument(
+        "--component-json",
+        type=str,
+        help="Read the resolved component as JSON from stdin ('-') instead of --update-def",
+    )
 
     args = parser.parse_args()
 
+    if args.component_json is None and args.update_def is None:
+        parser.error("--update-def is required unless --component-json is given")
+    if args.component_json is not None and args.component_json != "-":
+        parser.error("--component-json only supports '-' (stdin)")
+
     # Validate project path
     if not args.project_path.is_dir():
         print(f"Error: Project path not found: {args.project_path}", file=sys.stderr)
         sys.exit(1)
 
-    # Load update definitions
-    if not args.update_def.exists():
-        print(f"Error: Update definitions file not found: {args.update_def}", file=sys.stderr)
-        sys.exit(1)
-
-    with open(args.update_def, "r", encoding="utf-8") as f:
-        update_definitions = json.load(f)
-
-    # Create applier and apply update
-    try:
-        applier = UpdateApplier(
-            project_path=args.project_path,
-            update_definitions=update_definitions,
-            update_id=args.update_id,
-            component_index=args.component_index,
-            dry_run=args.dry_run,
-        )
-
-        result = applier.apply()
+    component = None
+    update_definitions: Dict[str, Any] = {}
+    if args.component_json is not None:
+        # Component passed inline by the caller; update_definitions.json is not read
+        component = json.load(sys.stdin)
+    else:
+        # Load update definitions
+        if not args.update_def.exists():
+            print(f"Error: Update definitions file not found: {args.update_def}", file=sys.stderr)
+            sys.exit(1)
 
-        # Output result as JSON
-        print(json.dumps(result, indent=2))
+        with open(args.update_def, "r", encoding="utf-8") as f:
+            update_definitions = json.load(f)
+
+    # Apply update
+    result = apply_component(
+        project_path=args.project_path,
+        update_definitions=update_definitions,
+        update_id=args.update_id,
+        component_index=args.component_index,
+        dry_run=args.dry_run,
+        component=component,
+    )
 
-        # Exit with appropriate code
-        if result["status"] == "failure":
-            sys.exit(1)
+    # Output result as JSON
+    print(json.dumps(result, indent=2))
 
-    except Exception as e:
-        result = {
-            "status": "failure",
-            "update_id": args.update_id,
-            "component_index": args.component_index,
-            "error": str(e),
-        }
-        print(json.dumps(result, indent=2))
+    # Exit with appropriate code
+    if result["status"] == "failure":
         sys.exit(1)
 
 
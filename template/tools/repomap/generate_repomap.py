@@ -33,14 +33,23 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import os
+import stat
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable
+from typing import BinaryIO
 
-from scope_manager import ScopeConfig, ProjectTypeDetector
-from pdf_generator import convert_to_pdf
+from scope_manager import ScopeConfig, ProjectTypeDetector, compile_patterns
+from pdf_generator import PdfStream, start_pdf_stream
+
+# Write buffer for the repomap output stream
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Worker threads for the stat pass (I/O bound, so oversubscribe the CPUs)
+STAT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
 def parse_args() -> argparse.Namespace:
@@ -93,51 +102,75 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def git_tracked_files(repo_root: Path) -> Iterable[str]:
-    """Get list of git-tracked files."""
+def git_tracked_files(repo_root: Path) -> list[bytes]:
+    """
+    Get list of git-tracked files as raw bytes paths.
+    Uses NUL-delimited output, so paths are never quoted and nothing is decoded up front.
+    """
     try:
         result = subprocess.run(
-            ["git", "ls-files"],
+            ["git", "ls-files", "-z"],
             cwd=repo_root,
             check=True,
             capture_output=True,
-            text=True,
         )
     except subprocess.CalledProcessError as exc:
         print("Failed to list tracked files via git ls-files", file=sys.stderr)
         raise SystemExit(exc.returncode) from exc
-    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+    return result.stdout.split(b"\0")[:-1]
 
 
-def should_include_file(
-    path: Path, rel_path: str, include_patterns: list[str], exclude_patterns: list[str], max_file_size: int
-) -> tuple[bool, str]:
+def stat_exclusion(st: os.stat_result | None, max_file_size: int, collect_reason: bool = True) -> str | None:
     """
-    Determine if file should be included.
-    Returns (should_include, reason).
+    Check a file's cached stat result. Returns the exclusion reason, or None if it passes.
+    With collect_reason=False the size is not formatted into the reason (caller only needs a verdict).
     """
-    from scope_manager import matches_patterns
+    if st is None or not stat.S_ISREG(st.st_mode):
+        return "not a file"
 
-    if not path.is_file():
-        return False, "not a file"
+    # Check file size
+    if max_file_size and st.st_size > max_file_size:
+        return f"too large ({st.st_size} bytes)" if collect_reason else "too large"
 
-    # Check exclusions first
-    if exclude_patterns and matches_patterns(rel_path, exclude_patterns):
-        return False, "excluded by pattern"
+    return None
 
-    # Check inclusions
-    if include_patterns and not matches_patterns(rel_path, include_patterns):
-        return False, "not included by pattern"
 
-    # Check file size
-    if max_file_size and path.stat().st_size > max_file_size:
-        return False, f"too large ({path.stat().st_size} bytes)"
+def stat_or_none(path: bytes) -> os.stat_result | None:
+    """os.stat that returns None for missing/unreadable paths (e.g. tracked but deleted)."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
 
-    return True, "included"
+def stat_files(paths: list[bytes]) -> list[os.stat_result | None]:
+    """
+    Stat many files concurrently.
+    os.stat releases the GIL, so a thread pool overlaps the syscall latency.
+    """
+    with ThreadPoolExecutor(max_workers=STAT_WORKERS) as executor:
+        return list(executor.map(stat_or_none, paths, chunksize=64))
+
+
+class TeeWriter:
+    """Write each chunk to the output file and to the PDF pipeline that renders it."""
 
+    def __init__(self, handle: BinaryIO, pdf_stream: PdfStream):
+        self.handle = handle
+        self.pdf_stream = pdf_stream
 
-def write_header(output: Path, repo_root: Path, file_count: int, scope_info: dict, total_size: int) -> None:
-    """Write header with metadata."""
+    def write(self, data: bytes) -> None:
+        self.handle.write(data)
+        self.pdf_stream.write(data)
+
+
+def write_header(
+    handle: BinaryIO | TeeWriter, repo_root: Path, file_count: int, scope_info: dict, selected_size: int
+) -> None:
+    """
+    Write header with metadata. selected_size is precomputed from the stat pass, so it
+    also counts files later skipped as non-UTF-8 (the header is written before they are read).
+    """
     timestamp = datetime.now(timezone.utc).isoformat()
     header_lines = [
         "# Scoped Repository Map",
@@ -146,7 +179,7 @@ def write_header(output: Path, repo_root: Path, file_count: int, scope_info: dic
         f"# Scope: {scope_info.get('name', 'custom')}",
         f"# Description: {scope_info.get('description', 'Custom scope')}",
         f"# Files included: {file_count}",
-        f"# Total size: {total_size:,} bytes ({total_size / 1024 / 1024:.2f} MB)",
+        f"# Total size of selected files: {selected_size:,} bytes ({selected_size / 1024 / 1024:.2f} MB)",
         f"# Max file size: {scope_info.get('max_file_size', 'N/A')} bytes",
         "",
         "# Include patterns:",
@@ -165,28 +198,29 @@ def write_header(output: Path, repo_root: Path, file_count: int, scope_info: dic
     header_lines.append("=" * 80)
     header_lines.append("")
 
-    output.write_text("\n".join(header_lines), encoding="utf-8")
+    handle.write("\n".join(header_lines).encode("utf-8", "surrogateescape"))
 
 
-def append_file(output: Path, repo_root: Path, rel_path: str) -> int:
-    """Append file content to output. Returns file size."""
-    target = repo_root / rel_path
-    try:
-        content = target.read_text(encoding="utf-8")
-        file_size = target.stat().st_size
-    except UnicodeDecodeError:
-        with output.open("a", encoding="utf-8") as handle:
-            handle.write(f"--- File: {rel_path} (skipped: non-UTF-8) ---\n\n")
-        return 0
-
-    payload = [f"--- File: {rel_path} ({file_size:,} bytes) ---\n", content]
-    if not content.endswith("\n"):
-        payload.append("\n")
-    payload.append("\n")
-
-    with output.open("a", encoding="utf-8") as handle:
-        handle.writelines(payload)
-
+def append_file(handle: BinaryIO | TeeWriter, full_path: bytes, rel_path: str, file_size: int) -> int:
+    """
+    Append file content to the open output stream. Returns the content size written (0 if skipped).
+    full_path and file_size come from the filter pass (no Path construction or re-stat here).
+    Content is copied as raw bytes; it is only decoded to validate UTF-8 when not pure ASCII.
+    rel_path may carry surrogate escapes (non-UTF-8 names); they are written back as the original bytes.
+    """
+    with open(full_path, "rb") as source:
+        content = source.read()
+    if not content.isascii():
+        try:
+            content.decode("utf-8")
+        except UnicodeDecodeError:
+            handle.write(f"--- File: {rel_path} (skipped: non-UTF-8) ---\n\n".encode("utf-8", "surrogateescape"))
+            return 0
+
+    handle.write(f"--- File: {rel_path} ({file_size:,} bytes) ---\n".encode("utf-8", "surrogateescape"))
+    handle.write(content)
+    # Blank separator line, plus a newline first if the file doesn't end with one
+    handle.write(b"\n" if content[-1:] == b"\n" else b"\n\n")
     return file_size
 
 
@@ -279,11 +313,11 @@ def main() -> None:
         print("Error: Must specify --scope, --scopes, --auto-detect, --include, or --list-scopes", file=sys.stderr)
         sys.exit(1)
 
-    # Add custom patterns if provided
+    # Add custom patterns if provided (new lists; never extend a scope's lists in place)
     if args.include_patterns:
-        scope_data["include_patterns"].extend(args.include_patterns)
+        scope_data["include_patterns"] = scope_data.get("include_patterns", []) + args.include_patterns
     if args.exclude_patterns:
-        scope_data["exclude_patterns"].extend(args.exclude_patterns)
+        scope_data["exclude_patterns"] = scope_data.get("exclude_patterns", []) + args.exclude_patterns
 
     # Override max file size if provided
     if args.max_file_size:
@@ -308,19 +342,37 @@ def main() -> None:
     included_files = []
     excluded_stats = {}
 
-    for rel_path in tracked:
-        full_path = repo_root / rel_path
-        should_include, reason = should_include_file(
-            full_path,
-            rel_path,
-            scope_data.get("include_patterns", []),
-            scope_data.get("exclude_patterns", []),
-            scope_data.get("max_file_size", 200000),
-        )
-
-        if should_include:
-            included_files.append(rel_path)
-        else:
+    # Compile patterns once, outside the per-file loop
+    include_set = compile_patterns(scope_data.get("include_patterns", []), binary=True)
+    exclude_set = compile_patterns(scope_data.get("exclude_patterns", []), binary=True)
+    max_file_size = scope_data.get("max_file_size", 200000)
+
+    # Exclusion bookkeeping only when --stats asked for it
+    collect_stats = args.stats
+
+    # Pattern pass first (pure string work, batched over the whole list), then stat only the candidates.
+    # Exclusions are checked first, then inclusions.
+    candidates = tracked
+    if exclude_set is not None:
+        candidates = exclude_set.reject(candidates)
+        if collect_stats and len(candidates) < len(tracked):
+            excluded_stats["excluded by pattern"] = len(tracked) - len(candidates)
+    if include_set is not None:
+        not_excluded = len(candidates)
+        candidates = include_set.select(candidates)
+        if collect_stats and len(candidates) < not_excluded:
+            excluded_stats["not included by pattern"] = not_excluded - len(candidates)
+
+    # Join each candidate's full path once; reused for both stat and open
+    root = os.fsencode(repo_root)
+    full_paths = [os.path.join(root, rel_path) for rel_path in candidates]
+    stat_results = stat_files(full_paths)
+
+    for rel_path, full_path, st in zip(candidates, full_paths, stat_results, strict=True):
+        reason = stat_exclusion(st, max_file_size, collect_stats)
+        if reason is None:
+            included_files.append((os.fsdecode(rel_path), full_path, st.st_size))
+        elif collect_stats:
             excluded_stats[reason] = excluded_stats.get(reason, 0) + 1
 
     # Write header
@@ -332,38 +384,45 @@ def main() -> None:
         "max_file_size": scope_data.get("max_file_size", 200000),
     }
 
+    # Automatically generate PDF (unless disabled or custom output specified). The
+    # enscript | ps2pdf pipeline starts now and renders the text while it is written.
+    generate_pdf = not args.no_pdf and not custom_output
+    pdf_file = output.parent / f"{output.stem}.pdf"
+    pdf_stream = start_pdf_stream(pdf_file) if generate_pdf else None
+
+    # Sizes are known from the stat pass, so the header is written once, up front
+    selected_size = sum(file_size for _, _, file_size in included_files)
     total_size = 0
-    write_header(output, repo_root, len(included_files), scope_info, 0)  # Will update later
+    try:
+        with output.open("wb", buffering=OUTPUT_BUFFER_SIZE) as handle:
+            sink = TeeWriter(handle, pdf_stream) if pdf_stream is not None else handle
+            write_header(sink, repo_root, len(included_files), scope_info, selected_size)
+
+            # Append files (already in git's index order, i.e. sorted by path)
+            for rel_path, full_path, file_size in included_files:
+                total_size += append_file(sink, full_path, rel_path, file_size)
+    except BaseException:
+        if pdf_stream is not None:
+            pdf_stream.abort()
+        raise
 
-    # Append files
-    for rel_path in sorted(included_files):
-        file_size = append_file(output, repo_root, rel_path)
-        total_size += file_size
+    print(f"✅ Scoped repository map generated: {output}")
 
-    # Update header with final size
-    content = output.read_text()
-    updated_content = content.replace(
-        "# Total size: 0 bytes (0.00 MB)", f"# Total size: {total_size:,} bytes ({total_size / 1024 / 1024:.2f} MB)"
-    )
-    output.write_text(updated_content)
+    # Print summary as a single write
+    summary_lines = [
+        f"📊 Files included: {len(included_files)}",
+        f"📏 Total size: {total_size:,} bytes ({total_size / 1024 / 1024:.2f} MB)",
+    ]
 
-    # Print summary
-    print(f"✅ Scoped repository map generated: {output}")
-    print(f"📊 Files included: {len(included_files)}")
-    print(f"📏 Total size: {total_size:,} bytes ({total_size / 1024 / 1024:.2f} MB)")
+    if args.stats:
+        summary_lines.append("\n📉 Excluded files:")
+        summary_lines.extend(f"  - {reason}: {count} files" for reason, count in sorted(excluded_stats.items()))
 
-    if args.stats or excluded_stats:
-        print("\n📉 Excluded files:")
-        for reason, count in sorted(excluded_stats.items()):
-            print(f"  - {reason}: {count} files")
+    sys.stdout.write("\n".join(summary_lines) + "\n")
 
-    # Automatically generate PDF (unless disabled or custom output specified)
-    if not args.no_pdf and not custom_output:
+    if generate_pdf:
         print("\n📄 Generating optimized PDF...")
-        pdf_file = output.parent / f"{output.stem}.pdf"
-        success = convert_to_pdf(output, pdf_file)
-
-        if success:
+        if pdf_stream is not None and pdf_stream.finish():
             txt_size_mb = output.stat().st_size / (1024 * 1024)
             pdf_size_mb = pdf_file.stat().st_size / (1024 * 1024)
             compression_ratio = (1 - pdf_size_mb / txt_size_mb) * 100
@@ -7,80 +7,179 @@ Converts text files to optimized PDFs using enscript and ps2pdf.
 
 from __future__ import annotations
 
+import shutil
 import subprocess
+import tempfile
 from pathlib import Path
 
 
-def convert_to_pdf(txt_file: Path, pdf_file: Path) -> bool:
+def enscript_command(source: str) -> list[str]:
+    """enscript (small font, no header) writing PostScript to stdout; source "-" reads stdin."""
+    return [
+        "enscript",
+        "-B",  # No header
+        "-f",
+        "Courier4",  # 4pt font for compact output
+        "--word-wrap",  # Wrap long lines
+        "--media=A4",  # A4 paper size
+        "-o",
+        "-",  # PostScript to stdout
+        source,
+    ]
+
+
+def ps2pdf_command(pdf_file: Path) -> list[str]:
+    """ps2pdf reading PostScript from stdin."""
+    return [
+        "ps2pdf",
+        "-dPDFSETTINGS=/ebook",  # Optimize for small file size
+        "-dCompressPages=true",
+        "-dUseFlateCompression=true",
+        "-",  # PostScript from stdin
+        str(pdf_file),
+    ]
+
+
+class PdfStream:
     """
-    Convert text file to optimized PDF using enscript and ps2pdf.
-    Returns True on success, False on failure.
+    enscript | ps2pdf pipeline fed through enscript's stdin.
+    Text passed to write() is rendered while the caller is still producing it;
+    finish() closes the input and waits for the PDF. Construction raises OSError
+    if a tool cannot be started (see start_pdf_stream).
     """
-    try:
-        # Step 1: Convert to PostScript with enscript (small font, no header)
-        ps_file = txt_file.parent / f"{txt_file.stem}.ps"
-
-        print("🔄 Converting to PostScript...")
-        enscript_result = subprocess.run(
-            [
-                "enscript",
-                "-B",  # No header
-                "-f",
-                "Courier4",  # 4pt font for compact output
-                "--word-wrap",  # Wrap long lines
-                "--media=A4",  # A4 paper size
-                "-o",
-                str(ps_file),
-                str(txt_file),
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-
-        if enscript_result.returncode != 0:
-            print(f"⚠️  enscript warning (continuing): {enscript_result.stderr[:200]}")
-
-        if not ps_file.exists():
-            print("❌ PostScript file not created")
-            return False
 
-        # Step 2: Convert PostScript to compressed PDF
-        print("🔄 Converting to compressed PDF...")
-        subprocess.run(
-            [
-                "ps2pdf",
-                "-dPDFSETTINGS=/ebook",  # Optimize for small file size
-                "-dCompressPages=true",
-                "-dUseFlateCompression=true",
-                str(ps_file),
-                str(pdf_file),
-            ],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        # Clean up PostScript file
-        ps_file.unlink()
-
-        if not pdf_file.exists():
-            print("❌ PDF file not created")
+    def __init__(self, pdf_file: Path):
+        self.pdf_file = pdf_file
+        # Tool output goes to temporary files, never to pipes nobody reads while write() blocks
+        self._enscript_stderr = tempfile.TemporaryFile()
+        self._ps2pdf_output = tempfile.TemporaryFile()
+        self._broken = False
+        try:
+            self.enscript = subprocess.Popen(
+                enscript_command("-"),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=self._enscript_stderr,
+            )
+        except OSError:
+            self._close_files()
+            raise
+        try:
+            self.ps2pdf = subprocess.Popen(
+                ps2pdf_command(pdf_file),
+                stdin=self.enscript.stdout,
+                stdout=self._ps2pdf_output,
+                stderr=subprocess.STDOUT,
+            )
+        except OSError:
+            self.enscript.kill()
+            self.enscript.stdin.close()
+            self.enscript.wait()
+            self._close_files()
+            raise
+        finally:
+            # Drop the parent's copy of the pipe so enscript sees EPIPE if ps2pdf exits early
+            self.enscript.stdout.close()
+
+    def write(self, data: bytes) -> None:
+        """Feed text to enscript (ignored once the pipeline has exited; finish() reports why)."""
+        if self._broken:
+            return
+        try:
+            self.enscript.stdin.write(data)
+        except BrokenPipeError:
+            self._broken = True
+
+    def abort(self) -> None:
+        """Stop both tools without producing a PDF."""
+        for process in (self.enscript, self.ps2pdf):
+            process.kill()
+        try:
+            self.enscript.stdin.close()
+        except BrokenPipeError:
+            pass
+        for process in (self.enscript, self.ps2pdf):
+            process.wait()
+        self._close_files()
+
+    def finish(self) -> bool:
+        """
+        Close enscript's input and wait for the PDF.
+        Returns True on success, False on failure.
+        """
+        try:
+            try:
+                self.enscript.stdin.close()
+            except BrokenPipeError:
+                pass
+            enscript_returncode = self.enscript.wait()
+            ps2pdf_returncode = self.ps2pdf.wait()
+
+            if enscript_returncode != 0:
+                self._enscript_stderr.seek(0)
+                message = self._enscript_stderr.read(200).decode("utf-8", errors="replace")
+                print(f"⚠️  enscript warning (continuing): {message}")
+
+            if ps2pdf_returncode != 0:
+                self._ps2pdf_output.seek(0)
+                raise subprocess.CalledProcessError(
+                    ps2pdf_returncode, ps2pdf_command(self.pdf_file), self._ps2pdf_output.read()
+                )
+
+            if not self.pdf_file.exists():
+                print("❌ PDF file not created")
+                return False
+
+            # Check size
+            pdf_size_mb = self.pdf_file.stat().st_size / (1024 * 1024)
+            print(f"✅ PDF created: {self.pdf_file.name} ({pdf_size_mb:.2f} MB)")
+
+            return True
+
+        except subprocess.CalledProcessError as e:
+            print(f"❌ PDF conversion failed: {e}")
             return False
+        except Exception as e:
+            print(f"❌ Unexpected error during PDF conversion: {e}")
+            return False
+        finally:
+            self._close_files()
 
-        # Check size
-        pdf_size_mb = pdf_file.stat().st_size / (1024 * 1024)
-        print(f"✅ PDF created: {pdf_file.name} ({pdf_size_mb:.2f} MB)")
+    def _close_files(self) -> None:
+        self._enscript_stderr.close()
+        self._ps2pdf_output.close()
 
-        return True
 
-    except subprocess.CalledProcessError as e:
-        print(f"❌ PDF conversion failed: {e}")
-        return False
+def start_pdf_stream(pdf_file: Path) -> PdfStream | None:
+    """
+    Start an enscript | ps2pdf pipeline writing pdf_file.
+    Returns None (after reporting why) if the tools cannot be started.
+    """
+    try:
+        return PdfStream(pdf_file)
     except FileNotFoundError as e:
         print(f"❌ Required tool not found: {e}")
         print("   Install with: sudo apt-get install enscript ghostscript")
+        return None
+    except OSError as e:
+        print(f"❌ Unexpected error during PDF conversion: {e}")
+        return None
+
+
+def convert_to_pdf(txt_file: Path, pdf_file: Path) -> bool:
+    """
+    Convert text file to optimized PDF using enscript and ps2pdf.
+    Returns True on success, False on failure.
+    """
+    print("🔄 Converting to compressed PDF (enscript | ps2pdf)...")
+    stream = start_pdf_stream(pdf_file)
+    if stream is None:
         return False
-    except Exception as e:
+    try:
+        with open(txt_file, "rb") as source:
+            shutil.copyfileobj(source, stream)
+    except OSError as e:
+        stream.abort()
         print(f"❌ Unexpected error during PDF conversion: {e}")
         return False
+    return stream.finish()
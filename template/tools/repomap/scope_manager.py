@@ -8,10 +8,26 @@ Manages scope configurations from JSON file and provides project type detection.
 from __future__ import annotations
 
 import fnmatch
+import functools
+import itertools
 import json
+import operator
+import os
+import re
 import sys
 from pathlib import Path
 
+# Optional fast JSON parsing (graceful fallback)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Glob -> regex translation, memoized per pattern string (combo scopes repeat the same globs)
+_translate = functools.lru_cache(maxsize=4096)(fnmatch.translate)
+
 
 class ScopeConfig:
     """Manages scope configurations from JSON file."""
@@ -19,6 +35,7 @@ class ScopeConfig:
     def __init__(self, config_path: Path):
         self.config_path = config_path
         self.config = self._load_config()
+        self._flat = self._flatten_scopes()
 
     def _load_config(self) -> dict:
         """Load scope configuration from JSON."""
@@ -27,7 +44,8 @@ class ScopeConfig:
             return {"scopes": {}, "scope_combinations": {}}
 
         try:
-            return json.loads(self.config_path.read_text())
+            # Parse straight from bytes (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+            return _json_loads(self.config_path.read_bytes())
         except json.JSONDecodeError as e:
             print(f"Error parsing config file: {e}", file=sys.stderr)
             sys.exit(1)
@@ -54,13 +72,30 @@ class ScopeConfig:
                 print(f"  Max total size: {combo.get('max_total_size', 'N/A')} bytes")
 
     def get_scope(self, scope_name: str) -> dict:
-        """Get a specific scope configuration."""
-        if scope_name in self.config.get("scopes", {}):
-            return self.config["scopes"][scope_name]
+        """
+        Get a specific scope configuration.
+        Returns a copy (with fresh pattern lists) so callers can't mutate the cached scope.
+        """
+        try:
+            scope = self._flat[scope_name]
+        except KeyError:
+            pass
+        else:
+            return {key: list(value) if isinstance(value, list) else value for key, value in scope.items()}
+
+        print(f"Error: Scope '{scope_name}' not found", file=sys.stderr)
+        print("Run with --list-scopes to see available scopes", file=sys.stderr)
+        sys.exit(1)
+
+    def _flatten_scopes(self) -> dict[str, dict]:
+        """
+        Build a flat {name: scope_data} map with every combination pre-merged.
+        Direct scopes take precedence over combinations of the same name.
+        """
+        scopes = self.config.get("scopes", {})
+        flat = {}
 
-        # Check if it's a combination
-        if scope_name in self.config.get("scope_combinations", {}):
-            combo = self.config["scope_combinations"][scope_name]
+        for name, combo in self.config.get("scope_combinations", {}).items():
             # Merge all scopes in the combination
             merged = {
                 "description": combo.get("description", ""),
@@ -70,16 +105,15 @@ class ScopeConfig:
             }
 
             for scope in combo.get("scopes", []):
-                if scope in self.config.get("scopes", {}):
-                    scope_data = self.config["scopes"][scope]
+                if scope in scopes:
+                    scope_data = scopes[scope]
                     merged["include_patterns"].extend(scope_data.get("include_patterns", []))
                     merged["exclude_patterns"].extend(scope_data.get("exclude_patterns", []))
 
-            return merged
+            flat[name] = merged
 
-        print(f"Error: Scope '{scope_name}' not found", file=sys.stderr)
-        print("Run with --list-scopes to see available scopes", file=sys.stderr)
-        sys.exit(1)
+        flat.update(scopes)
+        return flat
 
 
 class ProjectTypeDetector:
@@ -182,9 +216,107 @@ class ProjectTypeDetector:
             return [p for p in matches if p.is_file()][:5]
 
 
+_GLOB_CHARS = frozenset("*?[")
+
+
+class PatternSet:
+    """
+    Compiled set of glob patterns with hash/suffix fast paths.
+
+    Patterns are partitioned once:
+      - literal paths (no wildcards)      -> set membership
+      - "*<literal>" (e.g. "*.pyc")       -> str.endswith on a suffix tuple
+      - "**/*<literal>" (e.g. "**/*.pyc") -> suffix check plus a "/" before the suffix
+      - everything else                   -> a single compiled regex alternation
+    Semantics match fnmatch.fnmatch (case-sensitive, "*" crosses "/").
+    With binary=True all checks operate on bytes paths (e.g. raw `git ls-files -z` output).
+    """
+
+    def __init__(self, patterns: tuple[str, ...], binary: bool = False):
+        encode = os.fsencode if binary else str
+        self._sep = encode("/")
+        literals = set()
+        suffixes = []
+        deep_suffixes = []
+        complex_patterns = []
+
+        for pattern in patterns:
+            if not _GLOB_CHARS.intersection(pattern):
+                literals.add(encode(pattern))
+            elif pattern.startswith("*") and not _GLOB_CHARS.intersection(pattern[1:]):
+                suffixes.append(encode(pattern[1:]))
+            elif pattern.startswith("**/*") and len(pattern) > 4 and not _GLOB_CHARS.intersection(pattern[4:]):
+                deep_suffixes.append(encode(pattern[4:]))
+            else:
+                complex_patterns.append(pattern)
+
+        self._literals = frozenset(literals)
+        self._suffixes = tuple(suffixes)
+        self._deep_suffixes = tuple(deep_suffixes)
+        self._regex = None
+        if complex_patterns:
+            regex = "(?:" + ")|(?:".join(_translate(p) for p in complex_patterns) + ")"
+            self._regex = re.compile(os.fsencode(regex) if binary else regex)
+
+    def match(self, path: str | bytes) -> bool:
+        """Check if path matches any pattern in the set."""
+        if path in self._literals:
+            return True
+        if self._suffixes and path.endswith(self._suffixes):
+            return True
+        if self._deep_suffixes and self._match_deep_suffix(path):
+            return True
+        return self._regex is not None and self._regex.match(path) is not None
+
+    def select(self, paths: list) -> list:
+        """Batched match(): the paths matching any pattern, in input order."""
+        return list(filter(self._matched(paths).__contains__, paths))
+
+    def reject(self, paths: list) -> list:
+        """Batched match(): the paths matching no pattern, in input order."""
+        return list(itertools.filterfalse(self._matched(paths).__contains__, paths))
+
+    def _matched(self, paths: list) -> set:
+        """
+        Collect the matching paths one bucket at a time.
+        Each bucket is a single filter() pass driven by a C-level predicate
+        (set lookup, endswith, regex match), so there is no Python call per path
+        except for the "**/*<literal>" bucket's slash check.
+        """
+        matched = set(filter(self._literals.__contains__, paths))
+        if self._suffixes:
+            matched.update(filter(operator.methodcaller("endswith", self._suffixes), paths))
+        if self._deep_suffixes:
+            matched.update(filter(self._match_deep_suffix, paths))
+        if self._regex is not None:
+            matched.update(filter(self._regex.match, paths))
+        return matched
+
+    def _match_deep_suffix(self, path: str | bytes) -> bool:
+        """Match "**/*<literal>": path ends with the literal and has a "/" before it."""
+        if not path.endswith(self._deep_suffixes):
+            return False
+        for suffix in self._deep_suffixes:
+            if path.endswith(suffix) and self._sep in path[: len(path) - len(suffix)]:
+                return True
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_patterns(patterns: tuple[str, ...], binary: bool = False) -> PatternSet:
+    """Compile glob patterns into a PatternSet (cached per pattern tuple)."""
+    return PatternSet(patterns, binary)
+
+
+def compile_patterns(patterns: list[str], binary: bool = False) -> PatternSet | None:
+    """Compile glob patterns for repeated matching. Returns None for an empty list."""
+    if not patterns:
+        return None
+    return _compile_patterns(tuple(patterns), binary)
+
+
 def matches_patterns(path: str, patterns: list[str]) -> bool:
     """Check if path matches any of the glob patterns."""
-    for pattern in patterns:
-        if fnmatch.fnmatch(path, pattern):
-            return True
-    return False
+    if not patterns:
+        return False
+    return _compile_patterns(tuple(patterns)).match(path)
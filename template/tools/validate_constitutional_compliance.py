@@ -20,11 +20,18 @@ Exit codes:
 
 import ast
 import json
+import logging
+import os
 import re
 import sys
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
-from dataclasses import dataclass, field
+from typing import List, Dict, Iterable, Optional, TextIO
+from dataclasses import asdict, dataclass, field
+from functools import cached_property
+
+logger = logging.getLogger(__name__)
 
 # Colorama for output (optional dependency)
 try:
@@ -38,6 +45,80 @@ except ImportError:
         RESET_ALL = BRIGHT = ""
     HAS_COLOR = False
 
+# orjson for the config and --json report when available (optional dependency)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _write_json_report(report: Dict, violations: Iterable[Dict], out: TextIO) -> None:
+        """Write report plus its "violations" list as indented JSON"""
+        report = {**report, "violations": list(violations)}
+        out.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE).decode())
+except ImportError:
+    _json_loads = json.loads
+
+    def _write_json_report(report: Dict, violations: Iterable[Dict], out: TextIO) -> None:
+        """Write report plus its "violations" list as indented JSON, one violation at a time"""
+        # Same layout as json.dumps(indent=2) on the whole report, without holding
+        # every violation record at once
+        out.write(json.dumps(report, indent=2)[:-2])  # Reopen the closing "\n}"
+        out.write(',\n  "violations": [')
+        separator = "\n    "
+        for record in violations:
+            out.write(separator + json.dumps(record, indent=2).replace("\n", "\n    "))
+            separator = ",\n    "
+        out.write("]\n}\n" if separator == "\n    " else "\n  ]\n}\n")
+
+
+# Source patterns below are bytes: files are analyzed without decoding them to str
+# (ast.parse decodes bytes itself, honouring PEP 263 coding declarations)
+
+# Ignore directives (# tier1-constitution-ignore: article-X), compiled once per article
+IGNORE_DIRECTIVE_PATTERNS = {
+    article: re.compile(f"tier1-constitution-ignore:.*article-{article}".encode(), re.IGNORECASE)
+    for article in ("II", "IV", "VI")
+}
+
+# Source markers of MCP tools/APIs (Article IV), searched as one alternation
+CONTRACT_INDICATORS = (
+    "mcp.tool",
+    "@app.post",
+    "@app.get",
+    "FastAPI",
+    "GraphQL",
+)
+CONTRACT_PATTERN = re.compile(b"|".join(re.escape(marker.encode()) for marker in CONTRACT_INDICATORS))
+
+# Source markers of a CLI interface (Article VI), searched as one alternation; a
+# sibling cli.py also counts
+CLI_MARKERS = (
+    "if __name__ ==",
+    "@click.command",
+    "argparse.ArgumentParser",
+)
+CLI_PATTERN = re.compile(b"|".join(re.escape(marker.encode()) for marker in CLI_MARKERS))
+
+# Path fragments of source files that are not validated (virtualenvs, caches, tests),
+# matched anywhere in the path by one compiled alternation
+SKIP_FRAGMENTS = ('__pycache__', '.venv', 'venv', 'node_modules', '.git', 'tests/')
+SKIP_PATTERN = re.compile("|".join(map(re.escape, SKIP_FRAGMENTS)))
+
+# Below this many source files, files are read and parsed serially (worker start-up
+# would cost more than it saves)
+PARALLEL_MIN_FILES = 64
+
+# Per-file analysis cache (in cache_dir, git-ignored by its own .gitignore; main uses
+# .tier1_cache/ unless --no-cache):
+# entries are reused while a file's size and mtime are unchanged. Bump CACHE_VERSION
+# whenever the analysis rules change so stale entries are discarded.
+CACHE_FILENAME = "constitutional.json"
+CACHE_VERSION = 2
+
+# Common model suffixes (lowercase) stripped to find the base entity name (UserDTO -> user);
+# none is a suffix of another, so at most one can match
+MODEL_SUFFIXES = ("dto", "model", "schema", "response", "request", "entity")
+
 
 @dataclass
 class Violation:
@@ -51,6 +132,46 @@ class Violation:
     remediation: str = ""
 
 
+@dataclass
+class ClassSummary:
+    """Class definition facts needed by the Article II detectors"""
+    name: str
+    line_number: int
+    is_wrapper: bool  # See _is_simple_wrapper
+
+
+@dataclass
+class FileOutline:
+    """Parsed-file summary shared by the Article II and VI detectors"""
+    classes: List[ClassSummary]  # Class definitions outside function bodies, in ast.walk order
+    has_logic: bool  # Has a (non-nested) function with more than 5 statements
+
+
+@dataclass
+class FileFacts:
+    """Everything the validators need from one file's contents"""
+    outline: Optional[FileOutline]  # None if the file does not parse
+    ignored_articles: List[str]  # Articles with a tier1-constitution-ignore directive
+    has_cli_markers: bool  # See CLI_MARKERS
+    has_contract_indicators: bool  # See CONTRACT_INDICATORS
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "FileFacts":
+        """Rebuild from asdict() output (as stored in the analysis cache)"""
+        outline = data["outline"]
+        if outline is not None:
+            outline = FileOutline(
+                classes=[ClassSummary(**c) for c in outline["classes"]],
+                has_logic=outline["has_logic"]
+            )
+        return cls(
+            outline=outline,
+            ignored_articles=data["ignored_articles"],
+            has_cli_markers=data["has_cli_markers"],
+            has_contract_indicators=data["has_contract_indicators"]
+        )
+
+
 @dataclass
 class ValidationResult:
     """Validation result"""
@@ -71,19 +192,117 @@ class ValidationResult:
         return len(self.errors) == 0
 
 
+def _is_simple_wrapper(class_node: ast.ClassDef) -> bool:
+    """Heuristic: class with only simple delegation methods"""
+    body = class_node.body
+    if len(body) < 2:  # Too simple to be wrapper
+        return False
+
+    method_count = 0
+    delegation_count = 0
+
+    for item in body:
+        if isinstance(item, ast.FunctionDef):
+            method_count += 1
+            # Check if method just calls another function
+            if _is_simple_delegation(item):
+                delegation_count += 1
+
+    # If >50% of methods are simple delegations, likely a wrapper (integer form of
+    # delegation_count / method_count > 0.5)
+    return method_count > 0 and 2 * delegation_count > method_count
+
+
+def _model_base_name(class_name: str) -> str:
+    """Lowercase entity name without a common model suffix (UserDTO -> user)"""
+    base = class_name.lower()
+    for suffix in MODEL_SUFFIXES:
+        if base.endswith(suffix):
+            return base[:-len(suffix)]
+    return base
+
+
+def _is_simple_delegation(func_node: ast.FunctionDef) -> bool:
+    """Check if function just delegates to another call"""
+    body = func_node.body
+    return len(body) == 1 and isinstance(body[0], ast.Return) and isinstance(body[0].value, ast.Call)
+
+
+def outline_source(source: bytes, filename: str = "<unknown>") -> Optional[FileOutline]:
+    """Parse source and collect its classes and logic in one pass (None if it fails to parse)"""
+    try:
+        tree = ast.parse(source, filename=filename, type_comments=False)
+    except (SyntaxError, ValueError) as e:  # ValueError: undecodable source or null bytes
+        logger.debug("Cannot parse %s: %s", filename, e)
+        return None
+
+    # Breadth-first like ast.walk, but only over statements: expressions
+    # are skipped and function bodies are not descended into
+    classes = []
+    has_logic = False
+    pending = deque(tree.body)
+    while pending:
+        node = pending.popleft()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if isinstance(node, ast.FunctionDef) and len(node.body) > 5:
+                has_logic = True
+            continue
+        if isinstance(node, ast.ClassDef):
+            classes.append(ClassSummary(node.name, node.lineno, _is_simple_wrapper(node)))
+        pending.extend(
+            child for child in ast.iter_child_nodes(node)
+            if not isinstance(child, ast.expr)
+        )
+
+    return FileOutline(classes=classes, has_logic=has_logic)
+
+
+def analyze_source(source: bytes, filename: str = "<unknown>") -> FileFacts:
+    """Collect the facts all articles need from one file's source"""
+    return FileFacts(
+        outline=outline_source(source, filename),
+        ignored_articles=[
+            article for article, pattern in IGNORE_DIRECTIVE_PATTERNS.items()
+            if pattern.search(source)
+        ],
+        has_cli_markers=CLI_PATTERN.search(source) is not None,
+        has_contract_indicators=CONTRACT_PATTERN.search(source) is not None
+    )
+
+
+def load_file(file_path: Path) -> Optional[FileFacts]:
+    """Read and analyze one file (None if unreadable)"""
+    try:
+        source = file_path.read_bytes()
+    except OSError as e:
+        logger.debug("Cannot read %s: %s", file_path, e)
+        return None
+    return analyze_source(source, str(file_path))
+
+
 class ConstitutionalValidator:
     """Validates Tier1 projects against constitution"""
 
-    def __init__(self, project_root: Path, strict_mode: bool = False):
+    def __init__(self, project_root: Path, strict_mode: bool = False, cache_dir: Optional[Path] = None):
         self.project_root = project_root
         self.strict_mode = strict_mode
+        self.cache_dir = cache_dir  # Persist per-file analysis here across runs (None: off)
         self.result = ValidationResult()
 
+        # Per-run caches: each file is read and analyzed at most once across all articles
+        self._facts: Dict[Path, Optional[FileFacts]] = {}
+        self._file_keys: Dict[Path, List[int]] = {}
+        self._cli_dirs: Dict[Path, bool] = {}  # Directory -> has cli.py
+
     def validate(self, articles: Optional[List[str]] = None) -> ValidationResult:
         """Validate specified articles or all"""
         if articles is None:
             articles = ["II", "IV", "VI"]
 
+        # Articles II and VI outline every (non-skipped) source file
+        if "II" in articles or "VI" in articles:
+            self._preload(self._py_files)
+
         for article in articles:
             if article == "II":
                 self._validate_article_ii()
@@ -93,18 +312,12 @@ class ConstitutionalValidator:
                 self._validate_article_vi()
 
         self.result.articles_validated = articles
+        self._save_cache()
         return self.result
 
     def _validate_article_ii(self):
         """Article II: Anti-Abstraction Principle"""
-        src_dir = self.project_root / "src"
-        if not src_dir.exists():
-            return
-
-        for py_file in src_dir.rglob("*.py"):
-            if self._should_skip(py_file):
-                continue
-
+        for py_file in self._py_files:
             self.result.files_scanned += 1
 
             # Check for ignore directive
@@ -140,12 +353,8 @@ class ConstitutionalValidator:
 
     def _validate_article_vi(self):
         """Article VI: Observable Systems"""
-        src_dir = self.project_root / "src"
-        if not src_dir.exists():
-            return
-
         # Find service modules (files with classes or significant logic)
-        services = self._find_service_modules(src_dir)
+        services = self._find_service_modules()
 
         for service in services:
             if self._has_ignore_directive(service, "VI"):
@@ -166,191 +375,202 @@ class ConstitutionalValidator:
 
     # Helper methods
 
+    @cached_property
+    def _py_files(self) -> List[Path]:
+        """Source files to validate: .py files under src/ minus skipped paths, walked once per run"""
+        files = []
+        for root, dirs, names in os.walk(self.project_root / "src"):
+            # Prune skipped directories (a file below one always matches SKIP_PATTERN)
+            dirs[:] = [d for d in dirs if not SKIP_PATTERN.search(d + "/")]
+            files.extend(Path(root, name) for name in names if name.endswith(".py"))
+        return [p for p in files if not self._should_skip(p)]
+
+    def _preload(self, files: List[Path]) -> None:
+        """Fill the per-run facts for many files at once, analyzing in worker processes"""
+        pending = [f for f in files if f not in self._facts and not self._restore(f)]
+        if len(pending) < PARALLEL_MIN_FILES:
+            return  # Analyzed on demand instead
+
+        with ProcessPoolExecutor() as executor:
+            for file_path, facts in zip(pending, executor.map(load_file, pending, chunksize=32)):
+                self._facts[file_path] = facts
+
+    def _file_facts(self, file_path: Path) -> Optional[FileFacts]:
+        """Facts for a file, analyzed at most once per run (None if unreadable)"""
+        if file_path not in self._facts:
+            # A stored key means _preload already tried the analysis cache (and missed)
+            if file_path in self._file_keys or not self._restore(file_path):
+                self._facts[file_path] = load_file(file_path)
+        return self._facts[file_path]
+
+    @cached_property
+    def _disk_cache(self) -> Dict[str, List]:
+        """{relative path: [size, mtime_ns, facts]} from the previous run (empty if stale)"""
+        if self.cache_dir is None:
+            return {}
+        try:
+            with open(self.cache_dir / CACHE_FILENAME, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+            return {}
+        return cache.get("files", {})
+
+    def _cache_key(self, file_path: Path) -> str:
+        """Analysis cache key: path relative to the project root"""
+        return file_path.relative_to(self.project_root).as_posix()
+
+    def _restore(self, file_path: Path) -> bool:
+        """Take a file's facts from the analysis cache if it is unchanged since they were stored"""
+        if self.cache_dir is None:
+            return False
+        # Stat before any read, so a file modified mid-run is re-analyzed next time
+        try:
+            st = file_path.stat()
+        except OSError:
+            return False
+        key = [st.st_size, st.st_mtime_ns]
+        self._file_keys[file_path] = key
+
+        entry = self._disk_cache.get(self._cache_key(file_path))
+        if entry is None or entry[:2] != key:
+            return False
+        self._facts[file_path] = FileFacts.from_dict(entry[2]) if entry[2] is not None else None
+        return True
+
+    def _save_cache(self) -> None:
+        """Store this run's facts (plus entries for untouched files still present)"""
+        if self.cache_dir is None:
+            return
+
+        current = {self._cache_key(p) for p in self._py_files}
+        files = {name: entry for name, entry in self._disk_cache.items() if name in current}
+        for file_path, facts in self._facts.items():
+            if file_path in self._file_keys:
+                files[self._cache_key(file_path)] = [
+                    *self._file_keys[file_path],
+                    asdict(facts) if facts is not None else None
+                ]
+
+        # Best effort: an unwritable cache only costs the next run its speed-up
+        cache_path = self.cache_dir / CACHE_FILENAME
+        tmp_path = cache_path.with_suffix('.json.tmp')
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            # Self-ignoring cache dir, so `git add .` in the project never commits it
+            gitignore = self.cache_dir / ".gitignore"
+            if not gitignore.exists():
+                gitignore.write_text("# Automatically created by validate_constitutional_compliance.py\n*\n")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": CACHE_VERSION, "files": files}, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
     def _should_skip(self, path: Path) -> bool:
         """Skip certain paths"""
-        skip_patterns = ['__pycache__', '.venv', 'venv', 'node_modules', '.git', 'tests/']
-        return any(pattern in str(path) for pattern in skip_patterns)
+        return SKIP_PATTERN.search(str(path)) is not None
 
     def _has_ignore_directive(self, file_path: Path, article: str) -> bool:
         """Check for # tier1-constitution-ignore: article-X"""
-        try:
-            content = file_path.read_text()
-            pattern = f"tier1-constitution-ignore:.*article-{article}"
-            return bool(re.search(pattern, content, re.IGNORECASE))
-        except:
-            return False
+        facts = self._file_facts(file_path)
+        return facts is not None and article in facts.ignored_articles
 
     def _detect_wrappers(self, file_path: Path) -> List[Violation]:
         """Detect wrapper classes that just delegate"""
         violations = []
-        try:
-            tree = ast.parse(file_path.read_text())
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    if self._is_simple_wrapper(node):
-                        violations.append(Violation(
-                            article="II",
-                            severity="warning",
-                            rule="anti-abstraction",
-                            message=f"Possible unnecessary wrapper class: {node.name}",
-                            file_path=file_path,
-                            line_number=node.lineno,
-                            remediation="Consider using framework/library directly"
-                        ))
-        except:
-            pass
+        facts = self._file_facts(file_path)
+        if facts is None or facts.outline is None:
+            return violations
+
+        for cls in facts.outline.classes:
+            if cls.is_wrapper:
+                violations.append(Violation(
+                    article="II",
+                    severity="warning",
+                    rule="anti-abstraction",
+                    message=f"Possible unnecessary wrapper class: {cls.name}",
+                    file_path=file_path,
+                    line_number=cls.line_number,
+                    remediation="Consider using framework/library directly"
+                ))
 
         return violations
 
-    def _is_simple_wrapper(self, class_node: ast.ClassDef) -> bool:
-        """Heuristic: class with only simple delegation methods"""
-        if len(class_node.body) < 2:  # Too simple to be wrapper
-            return False
-
-        method_count = 0
-        delegation_count = 0
-
-        for item in class_node.body:
-            if isinstance(item, ast.FunctionDef):
-                method_count += 1
-                # Check if method just calls another function
-                if self._is_simple_delegation(item):
-                    delegation_count += 1
-
-        # If >50% of methods are simple delegations, likely a wrapper
-        if method_count > 0 and delegation_count / method_count > 0.5:
-            return True
-
-        return False
-
-    def _is_simple_delegation(self, func_node: ast.FunctionDef) -> bool:
-        """Check if function just delegates to another call"""
-        if len(func_node.body) == 1:
-            stmt = func_node.body[0]
-            if isinstance(stmt, ast.Return):
-                if isinstance(stmt.value, ast.Call):
-                    return True
-        return False
-
     def _detect_redundant_models(self, file_path: Path) -> List[Violation]:
         """Detect multiple models for same entity (User, UserDTO, UserModel, etc.)"""
         violations = []
-        try:
-            tree = ast.parse(file_path.read_text())
-
-            # Extract class names
-            class_names = [node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
-
-            # Group by base name (User, UserDTO, UserResponse -> "user")
-            base_names = {}
-            for name in class_names:
-                # Remove common suffixes
-                base = re.sub(r'(DTO|Model|Schema|Response|Request|Entity)$', '', name, flags=re.IGNORECASE)
-                base = base.lower()
-
-                if base not in base_names:
-                    base_names[base] = []
-                base_names[base].append(name)
-
-            # Check for redundancy (3+ models for same entity)
-            for base, names in base_names.items():
-                if len(names) >= 3:
-                    violations.append(Violation(
-                        article="II",
-                        severity="warning",
-                        rule="anti-abstraction",
-                        message=f"Redundant models detected: {', '.join(names)}",
-                        file_path=file_path,
-                        remediation="Consider single model with optional fields (Pydantic defaults)"
-                    ))
-        except:
-            pass
+        facts = self._file_facts(file_path)
+        if facts is None or facts.outline is None:
+            return violations
+
+        # Base name per class (User, UserDTO, UserResponse -> "user"), counted first
+        classes = facts.outline.classes
+        bases = [_model_base_name(cls.name) for cls in classes]
+        counts = Counter(bases)
+
+        # Collect names only for redundant entities (3+ models for same base)
+        base_names = defaultdict(list)
+        for cls, base in zip(classes, bases):
+            if counts[base] >= 3:
+                base_names[base].append(cls.name)
+
+        for names in base_names.values():
+            violations.append(Violation(
+                article="II",
+                severity="warning",
+                rule="anti-abstraction",
+                message=f"Redundant models detected: {', '.join(names)}",
+                file_path=file_path,
+                remediation="Consider single model with optional fields (Pydantic defaults)"
+            ))
 
         return violations
 
     def _needs_contracts(self) -> bool:
         """Check if project implements MCP tools or APIs"""
-        indicators = [
-            "mcp.tool",
-            "@app.post",
-            "@app.get",
-            "FastAPI",
-            "GraphQL"
-        ]
-
-        src_dir = self.project_root / "src"
-        if not src_dir.exists():
-            return False
-
-        for py_file in src_dir.rglob("*.py"):
-            try:
-                content = py_file.read_text()
-                if any(indicator in content for indicator in indicators):
-                    return True
-            except:
-                pass
+        for py_file in self._py_files:
+            facts = self._file_facts(py_file)
+            if facts is not None and facts.has_contract_indicators:
+                return True
 
         return False
 
-    def _find_service_modules(self, src_dir: Path) -> List[Path]:
+    def _find_service_modules(self) -> List[Path]:
         """Find modules that likely contain services (classes, significant logic)"""
         services = []
 
-        for py_file in src_dir.rglob("*.py"):
-            if self._should_skip(py_file):
-                continue
-
+        for py_file in self._py_files:
             # Skip __init__.py and very small files
             if py_file.name == "__init__.py":
                 continue
 
-            try:
-                tree = ast.parse(py_file.read_text())
-
-                # Check if has classes (likely a service)
-                has_classes = any(isinstance(node, ast.ClassDef) for node in ast.walk(tree))
-
-                # Check if has significant functions (>5 lines)
-                has_logic = False
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        if len(node.body) > 5:
-                            has_logic = True
-                            break
+            facts = self._file_facts(py_file)
+            if facts is None or facts.outline is None:
+                continue
 
-                if has_classes or has_logic:
-                    services.append(py_file)
-            except:
-                pass
+            # Has classes (likely a service) or significant functions (>5 lines)
+            if facts.outline.classes or facts.outline.has_logic:
+                services.append(py_file)
 
         return services
 
     def _has_cli_interface(self, file_path: Path) -> bool:
         """Check if file has CLI interface"""
-        try:
-            content = file_path.read_text()
-
-            # Pattern 1: if __name__ == '__main__':
-            if "if __name__ ==" in content:
-                return True
-
-            # Pattern 2: click decorators
-            if "@click.command" in content:
-                return True
-
-            # Pattern 3: argparse
-            if "argparse.ArgumentParser" in content:
-                return True
+        facts = self._file_facts(file_path)
+        if facts is None:
+            return False
 
-            # Pattern 4: cli.py sibling file
-            cli_file = file_path.parent / "cli.py"
-            if cli_file.exists():
-                return True
+        # Patterns 1-3: __main__ block, click decorators, argparse
+        if facts.has_cli_markers:
+            return True
 
-            return False
-        except:
-            return False
+        # Pattern 4: cli.py sibling file (one stat per directory; exists() does not raise)
+        directory = file_path.parent
+        if directory not in self._cli_dirs:
+            self._cli_dirs[directory] = os.path.exists(directory / "cli.py")
+        return self._cli_dirs[directory]
 
 
 def print_report(result: ValidationResult, json_output: bool = False):
@@ -359,21 +579,21 @@ def print_report(result: ValidationResult, json_output: bool = False):
         report = {
             "compliant": result.passed,
             "articles_validated": result.articles_validated,
-            "files_scanned": result.files_scanned,
-            "violations": [
-                {
-                    "article": v.article,
-                    "severity": v.severity,
-                    "rule": v.rule,
-                    "message": v.message,
-                    "file": str(v.file_path) if v.file_path else None,
-                    "line": v.line_number,
-                    "remediation": v.remediation
-                }
-                for v in result.violations
-            ]
+            "files_scanned": result.files_scanned
         }
-        print(json.dumps(report, indent=2))
+        violations = (
+            {
+                "article": v.article,
+                "severity": v.severity,
+                "rule": v.rule,
+                "message": v.message,
+                "file": os.fspath(v.file_path) if v.file_path else None,
+                "line": v.line_number,
+                "remediation": v.remediation
+            }
+            for v in result.violations
+        )
+        _write_json_report(report, violations, sys.stdout)
         return
 
     # Terminal output
@@ -386,10 +606,8 @@ def print_report(result: ValidationResult, json_output: bool = False):
     print(f"{Fore.YELLOW}⚠️  Constitutional compliance: {len(result.violations)} violation(s){Style.RESET_ALL}\n")
 
     # Group by article
-    by_article = {}
+    by_article = defaultdict(list)
     for v in result.violations:
-        if v.article not in by_article:
-            by_article[v.article] = []
         by_article[v.article].append(v)
 
     for article, violations in sorted(by_article.items()):
@@ -412,6 +630,7 @@ def main():
     parser.add_argument('--json', action='store_true', help='Output as JSON')
     parser.add_argument('--strict', action='store_true', help='Strict mode (warnings become errors)')
     parser.add_argument('--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('--no-cache', action='store_true', help='Re-analyze every file (ignore .tier1_cache/)')
 
     args = parser.parse_args()
 
@@ -421,13 +640,15 @@ def main():
     config_file = project_root / ".tier1_config.json"
     if config_file.exists():
         try:
-            config = json.loads(config_file.read_text())
-            if config.get("constitutional_strict_mode"):
+            config = _json_loads(config_file.read_bytes())
+        except (OSError, ValueError) as e:  # ValueError: invalid JSON
+            logger.debug("Ignoring unreadable config %s: %s", config_file, e)
+        else:
+            if isinstance(config, dict) and config.get("constitutional_strict_mode"):
                 args.strict = True
-        except:
-            pass
 
-    validator = ConstitutionalValidator(project_root, strict_mode=args.strict)
+    cache_dir = None if args.no_cache else project_root / ".tier1_cache"
+    validator = ConstitutionalValidator(project_root, strict_mode=args.strict, cache_dir=cache_dir)
 
     articles = [args.article] if args.article else None
     result = validator.validate(articles)